@@ -1,17 +1,56 @@
 import os
 import json
+import shutil
+import multiprocessing
+import threading
+import pickle
+import mmap
 from datetime import datetime, timedelta
-import pdfplumber
 import re
 import pandas as pd
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 import csv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import tempfile
-from docx import Document
+import importlib.util
+from itertools import islice
+from docx_xml import run_xml, parrafo_xml, agregar_parrafos_xml
+
+# PyMuPDF extrae el texto en C; pdfplumber queda como alternativa si no está instalado
+try:
+    import fitz
+except ImportError:
+    fitz = None
+    import pdfplumber
+
+# lxml analiza el HTML en C; html.parser queda como alternativa
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# xlsxwriter escribe las celdas sin crear un objeto por cada una; openpyxl queda como alternativa.
+# No se usa constant_memory: pandas escribe columna por columna y ese modo descarta las celdas.
+# Sólo se verifica que esté instalado; pandas lo importa recién al escribir el primer Excel.
+EXCEL_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
+
+# orjson serializa mucho más rápido que json (opcional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Autómata Aho-Corasick para la búsqueda de palabras clave (opcional)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Configurar logging
 logging.basicConfig(
@@ -25,6 +64,198 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Patrones precompilados usados en la extracción de campos
+_PATRONES_FECHA = (
+    re.compile(r'Ciudad de Buenos Aires,\s*(\d{1,2}\s+de\s+[A-Za-zÁÉÍÓÚáéíóúñÑ]+\s+de\s+\d{4})'),
+    re.compile(r'(\d{2}/\d{2}/\d{4})'),
+)
+_PATRONES_ORGANISMO = (
+    re.compile(r'MINISTERIO\s+DE\s+[A-ZÁÉÍÓÚÑ\s]+'),
+    re.compile(r'SECRETARÍA\s+[A-ZÁÉÍÓÚÑ\s]+'),
+    re.compile(r'PRESIDENCIA\s+DE\s+LA\s+NACIÓN'),
+)
+_FIRMANTE_RE = re.compile(r'^[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+(?:\s+[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+)+$')
+
+# Tabla para quitar tildes al comparar palabras clave (la ñ se conserva)
+_SIN_TILDES = str.maketrans('ÁÉÍÓÚÜáéíóúü', 'AEIOUUaeiouu')
+
+def _normalizar(texto: str) -> str:
+    """Pasa el texto a minúsculas y sin tildes para la búsqueda de palabras clave"""
+    return texto.lower().translate(_SIN_TILDES)
+
+# Tablas para limpiar saltos de línea del contenido (escapados) y del título (espacios)
+_LIMPIEZA_CONTENIDO = str.maketrans({'\r': ' ', '\n': '\\n'})
+_LIMPIEZA_TITULO = str.maketrans({'\r': ' ', '\n': ' '})
+
+# Tabla para armar el nombre de archivo de cada cuenta
+_SLUG_CUENTA = str.maketrans({' ': '_', '/': '_'})
+
+# Separador para limpiar todos los textos de una columna con una sola llamada a translate
+_SEPARADOR_LOTE = '\x1e'
+
+def _traducir_en_lote(textos: List[str], tabla: Dict[int, str]) -> List[str]:
+    """Aplica la tabla a todos los textos de una vez: los une, traduce el bloque y lo vuelve a separar"""
+    bloque = _SEPARADOR_LOTE.join(textos)
+    if bloque.count(_SEPARADOR_LOTE) != len(textos) - 1:
+        # Algún texto ya contiene el separador: traducir uno por uno
+        return [texto.translate(tabla) for texto in textos]
+    return bloque.translate(tabla).split(_SEPARADOR_LOTE)
+
+# Clave con la que se guarda en el autómata la palabra clave vacía (add_word no acepta '')
+CLAVE_PALABRA_VACIA = '\0'
+
+# Cantidad de páginas que extrae cada tarea del pool de procesos
+PAGINAS_POR_TAREA = 8
+
+# Cantidad de documentos por archivo en los reportes Word por cuenta
+DOCUMENTOS_POR_PARTE_WORD = 50
+
+# Directorio donde se guardan los diccionarios Excel ya procesados
+CACHE_DIR = ".cache"
+
+# Versión del formato de la caché: se incrementa al cambiar cómo se procesan los Excel
+# (_normalizar, _cargar_diccionario, _construir_automata...), así no se reutilizan pickles viejos
+VERSION_CACHE = 1
+
+def _extraer_texto_pagina(pagina) -> str:
+    """Extrae el texto de una página con la librería PDF disponible"""
+    if fitz:
+        # PyMuPDF termina cada página con un salto de línea que pdfplumber no agrega
+        return pagina.get_text("text").rstrip('\n')
+    # Páginas sin caracteres (imágenes escaneadas): evitar la reconstrucción del texto
+    if not pagina.chars:
+        return ''
+    return pagina.extract_text() or ''
+
+def _extraer_textos_rango(args: Tuple[str, int, int]) -> List[str]:
+    """Extrae el texto de un rango de páginas (se ejecuta en un proceso aparte)"""
+    pdf_path, inicio, fin = args
+    if not fitz:
+        pdf = pdfplumber.open(pdf_path)
+        try:
+            return [_extraer_texto_pagina(pdf.pages[i]) for i in range(inicio, fin)]
+        finally:
+            pdf.close()
+    
+    # PyMuPDF lee directamente del archivo mapeado en memoria
+    with open(pdf_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as datos:
+        pdf = fitz.open(stream=datos, filetype='pdf')
+        try:
+            return [_extraer_texto_pagina(pdf[i]) for i in range(inicio, fin)]
+        finally:
+            # El documento debe liberarse antes de cerrar el mapeo
+            pdf.close()
+            del pdf
+
+# Etiquetas en negrita de la metadata, ya convertidas a XML
+_ETIQUETAS_XML = {
+    etiqueta: run_xml(etiqueta, negrita=True)
+    for etiqueta in ('Fecha: ', 'Organismo: ', 'Identificador: ', 'Temas detectados: ', 'Palabras clave: ')
+}
+
+def _agregar_documentos_word(doc, filas) -> None:
+    """Agrega al documento Word un bloque por cada fila (campos del documento, contenido)"""
+    # Cada documento se arma como texto XML a partir de plantillas y se parsea de una sola vez,
+    # en lugar de crear cada párrafo y run con la API de python-docx
+    estilo_h1 = doc.styles['Heading 1'].style_id
+    estilo_h2 = doc.styles['Heading 2'].style_id
+    descripcion_xml = parrafo_xml(run_xml('Descripción'), estilo_h2)
+    contenido_xml = parrafo_xml(run_xml('Contenido Completo'), estilo_h2)
+    separador_xml = parrafo_xml(run_xml('_' * 50)) + parrafo_xml()
+    
+    for (tipo, numero, fecha, organismo, identificador,
+         temas_detectados, palabras_clave, titulo), contenido in filas:
+        # Título del documento y metadata básica
+        partes = [
+            parrafo_xml(run_xml(f'{tipo} {numero or "S/N"}'), estilo_h1),
+            parrafo_xml(_ETIQUETAS_XML['Fecha: '] + run_xml(f'{fecha or "No especificada"}')),
+            parrafo_xml(_ETIQUETAS_XML['Organismo: '] + run_xml(f'{organismo or "No especificado"}')),
+        ]
+        
+        if identificador:
+            partes.append(parrafo_xml(_ETIQUETAS_XML['Identificador: '] + run_xml(identificador)))
+        
+        # Temas y palabras clave
+        if temas_detectados:
+            partes.append(parrafo_xml(_ETIQUETAS_XML['Temas detectados: '] + run_xml(temas_detectados)))
+        
+        if palabras_clave:
+            partes.append(parrafo_xml(_ETIQUETAS_XML['Palabras clave: '] + run_xml(palabras_clave)))
+        
+        # Título/descripción del documento
+        if titulo:
+            partes.append(descripcion_xml)
+            partes.append(parrafo_xml(run_xml(titulo)))
+        
+        # Contenido completo y separador entre documentos
+        partes.append(contenido_xml)
+        partes.append(parrafo_xml(run_xml(contenido)))
+        partes.append(separador_xml)
+        
+        agregar_parrafos_xml(doc, partes)
+
+def _generar_reportes_cuenta(cuenta: str, docs_cuenta: pd.DataFrame, contenido_render: pd.Series,
+                             dir_reportes: str, fecha_generacion: str) -> None:
+    """Genera los reportes Excel y Word de una cuenta (se ejecuta en un proceso aparte)"""
+    try:
+        slug = cuenta.translate(_SLUG_CUENTA)
+        
+        # 1. Guardar reporte Excel
+        nombre_excel = f"reporte_{slug}.xlsx"
+        ruta_excel = os.path.join(dir_reportes, nombre_excel)
+        
+        try:
+            docs_cuenta.to_excel(ruta_excel, index=False, engine=EXCEL_ENGINE)
+            logger.info(f"Generado reporte Excel para {cuenta} con {len(docs_cuenta)} documentos")
+        except Exception as e:
+            logger.warning(f"Error al guardar reporte Excel para {cuenta}: {str(e)}")
+        
+        # 2. Generar reporte Word, en partes de DOCUMENTOS_POR_PARTE_WORD documentos para
+        # no mantener en memoria el XML de todos a la vez
+        try:
+            # python-docx tarda en importarse: sólo se carga cuando hay reportes que generar
+            from docx import Document
+            
+            filas = zip(docs_cuenta[[
+                'tipo', 'numero', 'fecha', 'organismo', 'identificador',
+                'temas_detectados', 'palabras_clave', 'titulo'
+            ]].itertuples(index=False, name=None), contenido_render)
+            total_partes = max(1, -(-len(docs_cuenta) // DOCUMENTOS_POR_PARTE_WORD))
+            
+            for parte in range(1, total_partes + 1):
+                doc = Document()
+                
+                # Título
+                titulo = f'Reporte de Boletín Oficial - {cuenta}'
+                if total_partes > 1:
+                    titulo += f' (parte {parte} de {total_partes})'
+                doc.add_heading(titulo, 0)
+                
+                # Información general (la cantidad total sólo en la primera parte)
+                doc.add_paragraph(f'Fecha de generación: {fecha_generacion}')
+                if parte == 1:
+                    doc.add_paragraph(f'Total de documentos relevantes: {len(docs_cuenta)}')
+                    doc.add_paragraph()
+                
+                # Agregar los documentos de esta parte
+                _agregar_documentos_word(doc, islice(filas, DOCUMENTOS_POR_PARTE_WORD))
+                
+                # Guardar documento Word: la primera parte conserva el nombre de siempre
+                sufijo = '' if parte == 1 else f'_parte{parte}'
+                ruta_word = os.path.join(dir_reportes, f"reporte_detallado_{slug}{sufijo}.docx")
+                doc.save(ruta_word)
+                del doc
+            
+            logger.info(f"Generado reporte Word detallado para {cuenta} ({total_partes} parte/s)")
+            
+        except Exception as e:
+            logger.warning(f"Error al generar reporte Word para {cuenta}: {str(e)}")
+    
+    except Exception as e:
+        logger.warning(f"Error procesando cuenta {cuenta}: {str(e)}")
+
 class BoletinDownloader:
     """Clase para descargar el Boletín Oficial"""
     
@@ -34,6 +265,22 @@ class BoletinDownloader:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        
+        # Sesión compartida para reutilizar conexiones (keep-alive)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries))
+    
+    def close(self):
+        """Cierra la sesión HTTP y libera las conexiones"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def obtener_ultimo_boletin(self) -> Tuple[str, str]:
         """
@@ -60,7 +307,7 @@ class BoletinDownloader:
             nombre_archivo = f"boletin_{fecha_str}.pdf"
             
             # Verificar si el PDF existe
-            response = requests.head(pdf_url, headers=self.headers)
+            response = self.session.head(pdf_url)
             if response.status_code == 404:
                 # Si no existe, probar con el día anterior
                 fecha_actual = fecha_actual - timedelta(days=1)
@@ -69,7 +316,7 @@ class BoletinDownloader:
                 nombre_archivo = f"boletin_{fecha_str}.pdf"
                 
                 # Verificar nuevamente
-                response = requests.head(pdf_url, headers=self.headers)
+                response = self.session.head(pdf_url)
                 if response.status_code == 404:
                     raise ValueError(f"No se encontró el Boletín para la fecha {fecha_str}")
             
@@ -79,7 +326,74 @@ class BoletinDownloader:
         except Exception as e:
             logger.error(f"Error al obtener la URL del Boletín: {str(e)}")
             raise
-    
+
+    def _fechas_candidatas(self, dias: int = 7) -> List[str]:
+        """Genera las fechas hábiles más recientes en formato YYYYMMDD"""
+        fechas = []
+        fecha_actual = datetime.now()
+        while len(fechas) < dias:
+            if fecha_actual.weekday() <= 4:  # Solo días de semana
+                fechas.append(fecha_actual.strftime("%Y%m%d"))
+            fecha_actual = fecha_actual - timedelta(days=1)
+        return fechas
+
+    async def _probe_dates(self, fechas: List[str]) -> Optional[str]:
+        """
+        Consulta en paralelo las URLs de las fechas candidatas
+
+        Args:
+            fechas (List[str]): Fechas en formato YYYYMMDD, de la más reciente a la más antigua
+
+        Returns:
+            Optional[str]: La fecha más reciente con Boletín disponible, o None
+        """
+        import asyncio
+        import aiohttp
+
+        urls = [self.pdf_url_template.format(fecha=fecha) for fecha in fechas]
+        connector = aiohttp.TCPConnector(limit=8)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+            async def probar(url):
+                async with session.head(url, allow_redirects=False) as response:
+                    return response.status
+
+            estados = await asyncio.gather(*(probar(url) for url in urls), return_exceptions=True)
+
+        for fecha, estado in zip(fechas, estados):
+            if estado == 200:
+                return fecha
+        return None
+
+    def obtener_ultimo_boletin_async(self, dias: int = 7) -> Tuple[str, str]:
+        """
+        Obtiene la URL del último Boletín Oficial probando varias fechas en paralelo
+
+        Args:
+            dias (int): Cantidad de días hábiles hacia atrás a consultar
+
+        Returns:
+            Tuple[str, str]: (URL del PDF, nombre del archivo)
+        """
+        import asyncio
+
+        try:
+            logger.info(f"Buscando el último Boletín Oficial en los últimos {dias} días hábiles...")
+
+            fechas = self._fechas_candidatas(dias)
+            fecha_str = asyncio.run(self._probe_dates(fechas))
+            if fecha_str is None:
+                raise ValueError(f"No se encontró el Boletín entre {fechas[-1]} y {fechas[0]}")
+
+            pdf_url = self.pdf_url_template.format(fecha=fecha_str)
+            nombre_archivo = f"boletin_{fecha_str}.pdf"
+
+            logger.info(f"URL del Boletín encontrada: {pdf_url}")
+            return pdf_url, nombre_archivo
+
+        except Exception as e:
+            logger.error(f"Error al obtener la URL del Boletín: {str(e)}")
+            raise
+
     def descargar_boletin(self, url: str, nombre_archivo: str) -> str:
         """
         Descarga el PDF del Boletín Oficial
@@ -102,14 +416,13 @@ class BoletinDownloader:
             ruta_archivo = os.path.join(temp_dir, nombre_archivo)
             
             # Descargar el archivo
-            response = requests.get(url, headers=self.headers, stream=True)
+            response = self.session.get(url, stream=True)
             response.raise_for_status()
             
             # Guardar el archivo
+            response.raw.decode_content = True
             with open(ruta_archivo, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
             logger.info(f"Boletín descargado exitosamente: {ruta_archivo}")
             return ruta_archivo
@@ -149,8 +462,8 @@ class BoletinDownloader:
                 'Upgrade-Insecure-Requests': '1'
             }
             
-            # Iniciar sesión y obtener cookies
-            session = requests.Session()
+            # Reutilizar la sesión para mantener cookies y conexiones
+            session = self.session
             
             # 1. Acceder a la página principal para obtener cookies iniciales
             logger.info("Accediendo a la página principal...")
@@ -164,7 +477,7 @@ class BoletinDownloader:
             response.raise_for_status()
             
             # Analizar la página HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Buscar el botón de descarga
             download_button = soup.find('button', {
@@ -220,21 +533,23 @@ class BoletinDownloader:
             ruta_archivo = os.path.join(temp_dir, nombre_archivo)
             
             # Guardar el archivo
+            response.raw.decode_content = True
             with open(ruta_archivo, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
             logger.info(f"Boletín descargado exitosamente: {ruta_archivo}")
             return ruta_archivo
             
         except Exception as e:
             logger.error(f"Error al descargar la primera sección del Boletín: {str(e)}")
-            raise
+            # Sólo si falla la descarga directa se levanta un navegador
+            logger.info("Reintentando la descarga con Selenium...")
+            return self._fallback_selenium(fecha)
 
-    def descargar_primera_seccion_selenium(self, fecha: str = None) -> str:
+    def _fallback_selenium(self, fecha: str = None) -> str:
         """
-        Descarga la primera sección del Boletín Oficial usando Selenium
+        Descarga la primera sección del Boletín Oficial usando Selenium.
+        Se usa sólo cuando falla la descarga directa de descargar_primera_seccion
         
         Args:
             fecha (str, optional): Fecha en formato YYYYMMDD. Si no se proporciona, se usa la fecha actual
@@ -349,8 +664,20 @@ class BoletinPDFProcessor:
         os.makedirs(self.output_dir, exist_ok=True)
         
         # Cargar diccionario y cuentas
-        self.temas = self._cargar_diccionario()
-        self.cuentas = self._cargar_cuentas()
+        self.temas = self._cargar_con_cache('Diccionario.xlsx', 'diccionario.pkl', self._cargar_diccionario)
+        self.cuentas = self._cargar_con_cache('Cuentas.xlsx', 'cuentas.pkl', self._cargar_cuentas)
+        self._cuentas_por_tema = self._indexar_cuentas_por_tema()
+        self._palabras_normalizadas = {
+            palabra: _normalizar(palabra)
+            for tema_data in self.temas.values()
+            for palabra in tema_data['palabras_clave']
+        }
+        # El autómata depende sólo del diccionario: se guarda en la misma caché
+        self._automata = (
+            self._cargar_con_cache('Diccionario.xlsx', 'automata_temas.pkl', self._construir_automata)
+            if ahocorasick else None
+        )
+        self._prefiltro_palabras = self._construir_prefiltro() if self._automata is None else None
         
         # Patrones de expresiones regulares para el boletín
         self.patrones = {
@@ -370,27 +697,90 @@ class BoletinPDFProcessor:
             'DISPOSICIÓN': r'DISPOSICIÓN\s+(?:N[°º]\s*)?(\d+(?:/\d{4})?)',
             'DECISIÓN ADMINISTRATIVA': r'DECISIÓN\s+ADMINISTRATIVA\s+(?:N[°º]\s*)?(\d+(?:/\d{4})?)'
         }
+        
+        # Versiones compiladas de los patrones anteriores
+        self._patrones_c = {k: re.compile(v) for k, v in self.patrones.items()}
+        
+        # Un único patrón con un grupo por tipo para detectar el inicio de documentos
+        self._grupo_a_tipo = {f'tipo{i}': tipo for i, tipo in enumerate(self.tipos_documentos)}
+        self._inicio_documento_re = re.compile(
+            '|'.join(f'(?P<tipo{i}>{patron})' for i, patron in enumerate(self.tipos_documentos.values())),
+            re.IGNORECASE
+        )
+        
+        # Un patrón por tipo que encuentra número, identificador y códigos en una sola pasada.
+        # Cada alternativa va dentro de un lookahead para que una coincidencia no oculte
+        # a otra que empiece dentro de ella
+        self._campos_re = {
+            tipo: re.compile('|'.join([
+                f'(?=(?P<numero>{patron}))',
+                f"(?=(?P<identificador>{self.patrones['identificador']}))",
+                f"(?=(?P<codigo_publicacion>{self.patrones['codigo_publicacion']}))",
+                f"(?=(?P<codigo_hash>{self.patrones['codigo_hash']}))",
+            ]))
+            for tipo, patron in self.tipos_documentos.items()
+        }
+        
+        # Entradas del sumario: tipo, número y página en un solo patrón
+        self._sumario_re = re.compile(
+            r'(?P<tipo>' + '|'.join(map(re.escape, self.tipos_documentos)) + r')'
+            r'\s+(?P<numero>\d+/\d{4}).*?\.+\s*pág\.\s*(?P<pagina>\d+)'
+        )
     
+    def _cargar_con_cache(self, ruta_excel: str, nombre_cache: str, cargar) -> Dict:
+        """
+        Ejecuta `cargar` reutilizando un pickle mientras el Excel no haya cambiado
+        
+        Args:
+            ruta_excel (str): Excel de origen; su fecha de modificación y tamaño (y VERSION_CACHE) invalidan la caché
+            nombre_cache (str): Nombre del archivo de caché dentro de CACHE_DIR
+            cargar: Función que lee el Excel y devuelve el diccionario procesado
+            
+        Returns:
+            Dict: El diccionario procesado
+        """
+        try:
+            firma = (VERSION_CACHE, os.path.getmtime(ruta_excel), os.path.getsize(ruta_excel))
+        except OSError:
+            return cargar()
+        
+        ruta_cache = os.path.join(CACHE_DIR, nombre_cache)
+        if os.path.exists(ruta_cache):
+            try:
+                with open(ruta_cache, 'rb') as f:
+                    firma_cache, datos = pickle.load(f)
+                if firma_cache == firma:
+                    logger.info(f"Usando caché de {ruta_excel}: {ruta_cache}")
+                    return datos
+            except Exception as e:
+                logger.warning(f"No se pudo leer la caché {ruta_cache}: {str(e)}")
+        
+        datos = cargar()
+        if datos:
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(ruta_cache, 'wb') as f:
+                    pickle.dump((firma, datos), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.warning(f"No se pudo guardar la caché {ruta_cache}: {str(e)}")
+        return datos
+
     def _cargar_diccionario(self) -> Dict:
         """Carga los temas y palabras clave del diccionario Excel"""
         try:
             df = pd.read_excel('Diccionario.xlsx', engine='openpyxl')
-            temas = {}
-            
-            # Iterar sobre las filas del DataFrame
-            for _, row in df.iterrows():
-                if pd.notna(row.iloc[0]):  # Si hay tema
-                    tema = str(row.iloc[0]).strip()
-                    if tema not in temas:
-                        temas[tema] = {
-                            'tema': tema,
-                            'palabras_clave': []
-                        }
-                    
-                    # Si hay palabra clave, agregarla
-                    if len(row) > 1 and pd.notna(row.iloc[1]):
-                        palabra_clave = str(row.iloc[1]).strip().lower()
-                        temas[tema]['palabras_clave'].append(palabra_clave)
+            
+            # Quedarse con las filas que tienen tema (primera columna)
+            df = df[df.iloc[:, 0].notna()]
+            columna_temas = df.iloc[:, 0].astype(str).str.strip()
+            temas = {tema: {'tema': tema, 'palabras_clave': []} for tema in columna_temas}
+            
+            # Agregar las palabras clave (segunda columna) ya normalizadas
+            if df.shape[1] > 1:
+                hay_palabra = df.iloc[:, 1].notna()
+                palabras = df.iloc[:, 1][hay_palabra].astype(str).str.strip().str.lower()
+                for tema, palabra_clave in zip(columna_temas[hay_palabra], palabras):
+                    temas[tema]['palabras_clave'].append(palabra_clave)
             
             logger.info(f"Se cargaron {len(temas)} temas del diccionario")
             return temas
@@ -402,32 +792,21 @@ class BoletinPDFProcessor:
         """Carga la información de cuentas y sus temas asociados desde el Excel"""
         try:
             df = pd.read_excel('Cuentas.xlsx', engine='openpyxl')
-            cuentas = {}
-            
-            # Procesar cada fila (empresa)
-            for idx, row in df.iterrows():
-                try:
-                    empresa = row['Empresa']
-                    if pd.isna(empresa):
-                        continue
-                    
-                    empresa = str(empresa).strip()
-                    if empresa not in cuentas:
-                        cuentas[empresa] = {
-                            'nombre': empresa,
-                            'temas': []
-                        }
-                    
-                    # Procesar cada columna de temáticas
-                    for columna in df.columns:
-                        if columna != 'Empresa' and pd.notna(row[columna]):
-                            tema = str(row[columna]).strip()
-                            if tema and tema not in cuentas[empresa]['temas']:
-                                cuentas[empresa]['temas'].append(tema)
-                
-                except Exception as row_error:
-                    logger.error(f"Error procesando fila {idx}: {str(row_error)}")
-                    continue
+            
+            # Quedarse con las filas que tienen empresa
+            df = df[df['Empresa'].notna()]
+            empresas = df['Empresa'].astype(str).str.strip()
+            cuentas = {empresa: {'nombre': empresa, 'temas': []} for empresa in empresas}
+            
+            # Apilar las columnas de temáticas fila por fila (descarta celdas vacías)
+            temas_df = df.drop(columns='Empresa')
+            temas_df.index = empresas
+            temas = temas_df.stack().dropna().astype(str).str.strip()
+            temas = temas[temas != '']
+            
+            # Temas sin duplicados, respetando el orden de aparición
+            for empresa, temas_empresa in temas.groupby(level=0, sort=False):
+                cuentas[empresa]['temas'] = list(dict.fromkeys(temas_empresa))
             
             logger.info(f"Se cargaron {len(cuentas)} cuentas")
             return cuentas
@@ -435,15 +814,77 @@ class BoletinPDFProcessor:
             logger.error(f"Error al cargar el archivo de cuentas: {str(e)}")
             return {}
 
+    def _indexar_cuentas_por_tema(self) -> Dict[str, set]:
+        """Construye el índice inverso tema -> cuentas interesadas"""
+        cuentas_por_tema = {}
+        for cuenta, data in self.cuentas.items():
+            for tema in data['temas']:
+                cuentas_por_tema.setdefault(tema, set()).add(cuenta)
+        return cuentas_por_tema
+
+    def _construir_automata(self):
+        """Construye un autómata Aho-Corasick con todas las palabras clave del diccionario"""
+        if ahocorasick is None:
+            return None
+        
+        # Cada palabra guarda dónde aparece: (posición del tema, posición de la palabra en el tema, tema, palabra original)
+        ubicaciones = {}
+        for indice_tema, tema_data in enumerate(self.temas.values()):
+            for indice_palabra, palabra_clave in enumerate(tema_data['palabras_clave']):
+                ubicaciones.setdefault(self._palabras_normalizadas[palabra_clave], []).append(
+                    (indice_tema, indice_palabra, tema_data['tema'], palabra_clave)
+                )
+        
+        automata = ahocorasick.Automaton()
+        for palabra_normalizada, lugares in ubicaciones.items():
+            # add_word no acepta la cadena vacía: se guarda con una clave que no aparece en los textos
+            automata.add_word(palabra_normalizada or CLAVE_PALABRA_VACIA, lugares)
+        
+        if len(automata) == 0:
+            return None
+        automata.make_automaton()
+        return automata
+
+    def _construir_prefiltro(self):
+        """Compila un único patrón con todas las palabras clave para descartar documentos sin coincidencias"""
+        palabras = set(self._palabras_normalizadas.values())
+        if not palabras:
+            return None
+        return re.compile('|'.join(map(re.escape, sorted(palabras, key=len, reverse=True))))
+
     def _clasificar_documento(self, texto: str) -> List[Dict]:
         """Clasifica un documento según los temas del diccionario"""
-        texto_lower = texto.lower()
+        # Texto y palabras clave se comparan en minúsculas y sin tildes
+        texto_normalizado = _normalizar(texto)
         temas_encontrados = []
         
+        # Con el autómata se recorre el texto una sola vez y cada coincidencia dice a qué temas pertenece
+        if self._automata is not None:
+            coincidencias = [lugares for _, lugares in self._automata.iter(texto_normalizado)]
+            # La palabra vacía está contenida en cualquier texto, igual que con 'in'
+            vacia = self._automata.get(CLAVE_PALABRA_VACIA, None)
+            if vacia is not None:
+                coincidencias.append(vacia)
+            
+            # Por cada tema, la palabra encontrada que figura primero en su lista
+            primeras = {}
+            for lugares in coincidencias:
+                for indice_tema, indice_palabra, tema, palabra_clave in lugares:
+                    if indice_tema not in primeras or indice_palabra < primeras[indice_tema][0]:
+                        primeras[indice_tema] = (indice_palabra, tema, palabra_clave)
+            for indice_tema in sorted(primeras):
+                _, tema, palabra_clave = primeras[indice_tema]
+                temas_encontrados.append({'tema': tema, 'palabra_encontrada': palabra_clave})
+            return temas_encontrados
+        
+        # Sin el autómata: si ninguna palabra clave aparece en el texto no hace falta recorrer los temas
+        if self._prefiltro_palabras is None or not self._prefiltro_palabras.search(texto_normalizado):
+            return temas_encontrados
+        
         for tema_data in self.temas.values():
             # Por cada palabra clave del tema, verificar si está contenida en el texto
             for palabra_clave in tema_data['palabras_clave']:
-                if palabra_clave in texto_lower:
+                if self._palabras_normalizadas[palabra_clave] in texto_normalizado:
                     tema_encontrado = {
                         'tema': tema_data['tema'],
                         'palabra_encontrada': palabra_clave
@@ -455,15 +896,12 @@ class BoletinPDFProcessor:
 
     def _encontrar_cuentas_interesadas(self, temas_documento: List[Dict]) -> List[str]:
         """Encuentra las cuentas interesadas en los temas del documento"""
-        cuentas_interesadas = []
+        cuentas_interesadas = set()
         
-        for cuenta, data in self.cuentas.items():
-            for tema_doc in temas_documento:
-                if tema_doc['tema'] in data['temas']:
-                    cuentas_interesadas.append(cuenta)
-                    break
+        for tema_doc in temas_documento:
+            cuentas_interesadas |= self._cuentas_por_tema.get(tema_doc['tema'], set())
         
-        return list(set(cuentas_interesadas))  # Eliminar duplicados
+        return list(cuentas_interesadas)
 
     def procesar_pdf(self, pdf_path: str) -> Optional[Dict]:
         """
@@ -491,49 +929,56 @@ class BoletinPDFProcessor:
                 "documentos": []
             }
             
-            pdf = pdfplumber.open(pdf_path)
-            logger.info(f"PDF abierto correctamente - {len(pdf.pages)} páginas")
+            pdf = fitz.open(pdf_path) if fitz else pdfplumber.open(pdf_path)
+            num_paginas = len(pdf) if fitz else len(pdf.pages)
+            logger.info(f"PDF abierto correctamente - {num_paginas} páginas")
+            
+            # Extraer el texto de todas las páginas
+            textos = self._extraer_textos_paginas(pdf_path, num_paginas)
             
             # Procesar sumario (primeras páginas)
-            sumario = self._extraer_sumario(pdf.pages[:3])
+            sumario = self._extraer_sumario(textos[:3])
             metadata["sumario"] = sumario
             
             # Procesar cada página
             documento_actual = None
-            texto_documento = []
+            lineas_documento = []
             
-            for i, pagina in enumerate(pdf.pages):
-                logger.info(f"Procesando página {i+1}/{len(pdf.pages)}...")
-                texto = pagina.extract_text()
+            for i, texto in enumerate(textos):
+                logger.info(f"Procesando página {i+1}/{num_paginas}...")
+                
+                if not texto.strip():
+                    logger.info(f"Página {i+1} sin texto (posible imagen escaneada), se omite")
+                    continue
                 
                 # Extraer metadata del boletín (solo en primera página)
                 if i == 0:
                     metadata.update(self._extraer_metadata_boletin(texto))
                 
                 # Procesar el contenido de la página
-                for linea in texto.split('\n'):
+                for linea in texto.splitlines():
                     nuevo_documento = self._detectar_inicio_documento(linea)
                     
                     if nuevo_documento:
                         # Guardar documento anterior si existe
-                        if documento_actual and texto_documento:
+                        if documento_actual and lineas_documento:
                             doc_procesado = self._procesar_documento(
                                 documento_actual,
-                                '\n'.join(texto_documento)
+                                lineas_documento
                             )
                             metadata["documentos"].append(doc_procesado)
                         
                         documento_actual = nuevo_documento
-                        texto_documento = [linea]
+                        lineas_documento = [linea]
                     else:
                         if documento_actual:
-                            texto_documento.append(linea)
+                            lineas_documento.append(linea)
             
             # Procesar último documento
-            if documento_actual and texto_documento:
+            if documento_actual and lineas_documento:
                 doc_procesado = self._procesar_documento(
                     documento_actual,
-                    '\n'.join(texto_documento)
+                    lineas_documento
                 )
                 metadata["documentos"].append(doc_procesado)
             
@@ -551,14 +996,32 @@ class BoletinPDFProcessor:
                 pdf.close()
                 logger.info("PDF cerrado correctamente")
 
-    def _extraer_sumario(self, paginas_iniciales: List) -> List[Dict]:
-        """Extrae el sumario de las primeras páginas"""
+    def _extraer_textos_paginas(self, pdf_path: str, num_paginas: int) -> List[str]:
+        """Extrae el texto de todas las páginas, repartiéndolas entre varios procesos"""
+        rangos = [
+            (pdf_path, inicio, min(inicio + PAGINAS_POR_TAREA, num_paginas))
+            for inicio in range(0, num_paginas, PAGINAS_POR_TAREA)
+        ]
+        procesos = min(os.cpu_count() or 1, len(rangos))
+        
+        # Desde la GUI el procesamiento corre en un thread: ahí no se crean procesos
+        # (sería un fork del proceso de Tk con varios threads)
+        if procesos <= 1 or threading.current_thread() is not threading.main_thread():
+            resultados = [_extraer_textos_rango(rango) for rango in rangos]
+        else:
+            logger.info(f"Extrayendo texto con {procesos} procesos...")
+            with multiprocessing.Pool(processes=procesos) as pool:
+                resultados = pool.map(_extraer_textos_rango, rangos)
+        
+        # Los resultados llegan en el orden de los rangos
+        return [texto for textos_rango in resultados for texto in textos_rango]
+
+    def _extraer_sumario(self, textos_iniciales: List[str]) -> List[Dict]:
+        """Extrae el sumario del texto de las primeras páginas"""
         sumario = []
         en_sumario = False
         
-        for pagina in paginas_iniciales:
-            texto = pagina.extract_text()
-            
+        for texto in textos_iniciales:
             # Detectar inicio del sumario
             if "SUMARIO" in texto and not en_sumario:
                 en_sumario = True
@@ -568,22 +1031,19 @@ class BoletinPDFProcessor:
                 continue
             
             # Procesar líneas del sumario
-            for linea in texto.split('\n'):
+            for linea in texto.splitlines():
                 if not linea.strip():
                     continue
                     
                 # Detectar entradas del sumario (ejemplo: "Decreto 350/2025...")
-                for tipo in self.tipos_documentos.keys():
-                    if tipo in linea:
-                        match = re.search(fr'{tipo}\s+(\d+/\d{4}).*?\.+\s*pág\.\s*(\d+)', linea)
-                        if match:
-                            sumario.append({
-                                "tipo": tipo,
-                                "numero": match.group(1),
-                                "pagina": int(match.group(2)),
-                                "referencia": linea.strip()
-                            })
-                            break
+                match = self._sumario_re.search(linea)
+                if match:
+                    sumario.append({
+                        "tipo": match.group('tipo'),
+                        "numero": match.group('numero'),
+                        "pagina": int(match.group('pagina')),
+                        "referencia": linea.strip()
+                    })
                 
                 # Detectar fin del sumario
                 if "Primera Sección" in linea:
@@ -596,12 +1056,12 @@ class BoletinPDFProcessor:
         metadata = {}
         
         # Extraer número de boletín
-        match = re.search(self.patrones['numero_boletin'], texto)
+        match = self._patrones_c['numero_boletin'].search(texto)
         if match:
             metadata['numero_boletin'] = match.group(1)
         
         # Extraer fecha
-        match = re.search(self.patrones['fecha_boletin'], texto)
+        match = self._patrones_c['fecha_boletin'].search(texto)
         if match:
             metadata['fecha_boletin'] = f"{match.group(1)} de {match.group(2)} de {match.group(3)}"
         
@@ -609,59 +1069,64 @@ class BoletinPDFProcessor:
     
     def _detectar_inicio_documento(self, linea: str) -> Optional[str]:
         """Detecta si una línea corresponde al inicio de un nuevo documento"""
-        for tipo, patron in self.tipos_documentos.items():
-            if re.match(patron, linea, re.IGNORECASE):
-                return tipo
-        return None
+        match = self._inicio_documento_re.match(linea)
+        return self._grupo_a_tipo[match.lastgroup] if match else None
     
-    def _procesar_documento(self, tipo: str, texto: str) -> Dict[str, Any]:
-        """Procesa un documento individual y extrae su información"""
+    def _procesar_documento(self, tipo: str, lineas: List[str]) -> Dict[str, Any]:
+        """Procesa un documento individual (lista de líneas) y extrae su información"""
+        # El texto completo sólo se arma una vez para las búsquedas con regex
+        texto = '\n'.join(lineas)
+        campos = self._extraer_campos(tipo, texto)
         documento = {
             "tipo_documento": tipo,
-            "numero_documento": self._extraer_numero_documento(tipo, texto),
-            "identificador": self._extraer_identificador(texto),
+            "numero_documento": campos['numero'],
+            "identificador": campos['identificador'],
             "fecha": self._extraer_fecha(texto),
-            "titulo": self._extraer_titulo(texto),
+            "titulo": self._extraer_titulo(lineas),
             "organismo_emisor": self._extraer_organismo(texto),
             "contenido": texto,
-            "firmantes": self._extraer_firmantes(texto),
-            "codigo_publicacion": self._extraer_codigo_publicacion(texto),
-            "codigo_hash": self._extraer_codigo_hash(texto),
+            "firmantes": self._extraer_firmantes(lineas),
+            "codigo_publicacion": campos['codigo_publicacion'],
+            "codigo_hash": campos['codigo_hash'],
             "tiene_anexo_web": "ANEXO" in texto and "web" in texto.lower()
         }
         
         return documento
     
-    def _extraer_numero_documento(self, tipo: str, texto: str) -> Optional[str]:
-        """Extrae el número del documento"""
-        patron = self.tipos_documentos.get(tipo)
-        if patron:
-            match = re.search(patron, texto)
-            if match:
-                return match.group(1)
-        return None
-    
-    def _extraer_identificador(self, texto: str) -> Optional[str]:
-        """Extrae el identificador normativo"""
-        match = re.search(self.patrones['identificador'], texto)
-        return match.group() if match else None
+    def _extraer_campos(self, tipo: str, texto: str) -> Dict[str, Optional[str]]:
+        """Extrae número, identificador, código de publicación y código hash en una sola pasada"""
+        campos = dict.fromkeys(('numero', 'identificador', 'codigo_publicacion', 'codigo_hash'))
+        patron = self._campos_re.get(tipo)
+        if not patron:
+            return campos
+        
+        # Dos campos nunca empiezan en la misma posición, así que la primera
+        # coincidencia de cada uno es la misma que daría una búsqueda individual
+        pendientes = len(campos)
+        for match in patron.finditer(texto):
+            campo = match.lastgroup
+            if campos[campo] is None:
+                if campo == 'numero':
+                    # Del número sólo interesa el grupo interno, sin el tipo
+                    campos[campo] = match.group(patron.groupindex['numero'] + 1)
+                else:
+                    campos[campo] = match.group(campo)
+                pendientes -= 1
+                if not pendientes:
+                    break
+        
+        return campos
     
     def _extraer_fecha(self, texto: str) -> Optional[str]:
         """Extrae la fecha del documento"""
-        patrones = [
-            r'Ciudad de Buenos Aires,\s*(\d{1,2}\s+de\s+[A-Za-zÁÉÍÓÚáéíóúñÑ]+\s+de\s+\d{4})',
-            r'(\d{2}/\d{2}/\d{4})'
-        ]
-        
-        for patron in patrones:
-            match = re.search(patron, texto)
+        for patron in _PATRONES_FECHA:
+            match = patron.search(texto)
             if match:
                 return match.group(1)
         return None
     
-    def _extraer_titulo(self, texto: str) -> Optional[str]:
+    def _extraer_titulo(self, lineas: List[str]) -> Optional[str]:
         """Extrae el título o descripción del documento"""
-        lineas = texto.split('\n')
         for i, linea in enumerate(lineas[:5]):  # Buscar en las primeras 5 líneas
             if '-' in linea and len(linea) > 10:
                 return linea.strip()
@@ -669,39 +1134,17 @@ class BoletinPDFProcessor:
     
     def _extraer_organismo(self, texto: str) -> Optional[str]:
         """Extrae el organismo emisor"""
-        organismos = [
-            r'MINISTERIO\s+DE\s+[A-ZÁÉÍÓÚÑ\s]+',
-            r'SECRETARÍA\s+[A-ZÁÉÍÓÚÑ\s]+',
-            r'PRESIDENCIA\s+DE\s+LA\s+NACIÓN'
-        ]
-        
-        for patron in organismos:
-            match = re.search(patron, texto)
+        for patron in _PATRONES_ORGANISMO:
+            match = patron.search(texto)
             if match:
                 return match.group().strip()
         return None
     
-    def _extraer_firmantes(self, texto: str) -> List[str]:
+    def _extraer_firmantes(self, lineas: List[str]) -> List[str]:
         """Extrae los nombres de los firmantes"""
-        firmantes = []
-        lineas = texto.split('\n')
-        
-        # Buscar líneas que parezcan nombres al final del documento
-        for linea in lineas[-10:]:  # Últimas 10 líneas
-            if re.match(r'^[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+(\s+[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+)+$', linea):
-                firmantes.append(linea.strip())
-        
-        return firmantes
-    
-    def _extraer_codigo_publicacion(self, texto: str) -> Optional[str]:
-        """Extrae el código de publicación"""
-        match = re.search(self.patrones['codigo_publicacion'], texto)
-        return match.group() if match else None
-    
-    def _extraer_codigo_hash(self, texto: str) -> Optional[str]:
-        """Extrae el código hash interno"""
-        match = re.search(self.patrones['codigo_hash'], texto)
-        return match.group() if match else None
+        # Buscar líneas que parezcan nombres entre las últimas 10 del documento
+        ultimas = (linea.strip() for linea in lineas[-10:])
+        return [linea for linea in ultimas if _FIRMANTE_RE.match(linea)]
     
     def _guardar_resultados(self, metadata: Dict) -> None:
         """Guarda los resultados en diferentes formatos"""
@@ -713,56 +1156,71 @@ class BoletinPDFProcessor:
             # Asegurarse de que el directorio existe y tenemos permisos
             os.makedirs(self.output_dir, exist_ok=True)
             
-            # Preparar datos para el CSV
-            documentos_data = []
-            for doc in metadata['documentos']:
-                # Limpiar y escapar el contenido
-                contenido_limpio = doc['contenido'].replace('\r', ' ').replace('\n', '\\n')
-                
-                # Clasificar el documento
+            # Armar las columnas directamente desde los documentos extraídos
+            # (pandas construye más rápido desde un diccionario de listas que desde filas)
+            documentos = metadata['documentos']
+            columnas = {
+                columna: [documento[campo] for documento in documentos]
+                for columna, campo in (
+                    ('tipo', 'tipo_documento'), ('numero', 'numero_documento'), ('fecha', 'fecha'),
+                    ('titulo', 'titulo'), ('organismo', 'organismo_emisor'), ('identificador', 'identificador'),
+                    ('codigo_publicacion', 'codigo_publicacion'), ('codigo_hash', 'codigo_hash'),
+                    ('firmantes', 'firmantes'), ('tiene_anexo_web', 'tiene_anexo_web'),
+                    ('contenido_completo', 'contenido'),
+                )
+            }
+            
+            # Limpiar y escapar el contenido y el título de todos los documentos a la vez
+            columnas['contenido_completo'] = _traducir_en_lote(columnas['contenido_completo'], _LIMPIEZA_CONTENIDO)
+            columnas['titulo'] = _traducir_en_lote([titulo or '' for titulo in columnas['titulo']], _LIMPIEZA_TITULO)
+            columnas['firmantes'] = ['; '.join(firmantes) for firmantes in columnas['firmantes']]
+            
+            # Clasificar cada documento y buscar las cuentas interesadas
+            temas_detectados = []
+            palabras_clave = []
+            cuentas_documento = []
+            filas_por_cuenta = {}  # Índice inverso cuenta -> posiciones de sus documentos en df
+            for fila, contenido_limpio in enumerate(columnas['contenido_completo']):
                 temas_encontrados = self._clasificar_documento(contenido_limpio)
                 cuentas_interesadas = self._encontrar_cuentas_interesadas(temas_encontrados)
-                
-                # Crear un diccionario con todos los campos relevantes
-                documento = {
-                    'tipo': doc['tipo_documento'],
-                    'numero': doc['numero_documento'],
-                    'fecha': doc['fecha'],
-                    'titulo': doc['titulo'].replace('\r', ' ').replace('\n', ' ') if doc['titulo'] else '',
-                    'organismo': doc['organismo_emisor'],
-                    'identificador': doc['identificador'],
-                    'codigo_publicacion': doc['codigo_publicacion'],
-                    'codigo_hash': doc['codigo_hash'],
-                    'firmantes': '; '.join(doc['firmantes']) if doc['firmantes'] else '',
-                    'tiene_anexo_web': doc['tiene_anexo_web'],
-                    'temas_detectados': '; '.join(t['tema'] for t in temas_encontrados),
-                    'palabras_clave': '; '.join(t['palabra_encontrada'] for t in temas_encontrados),
-                    'cuentas_interesadas': '; '.join(cuentas_interesadas),
-                    'contenido_completo': contenido_limpio
-                }
-                documentos_data.append(documento)
-            
-            # Crear DataFrame
-            df = pd.DataFrame(documentos_data)
-            
-            # Reordenar columnas para mejor legibilidad
+                for cuenta in cuentas_interesadas:
+                    filas_por_cuenta.setdefault(cuenta, []).append(fila)
+                temas_detectados.append('; '.join([t['tema'] for t in temas_encontrados]))
+                palabras_clave.append('; '.join([t['palabra_encontrada'] for t in temas_encontrados]))
+                cuentas_documento.append('; '.join(cuentas_interesadas))
+            
+            columnas['temas_detectados'] = temas_detectados
+            columnas['palabras_clave'] = palabras_clave
+            columnas['cuentas_interesadas'] = cuentas_documento
+            
+            # Columnas en el orden de salida, para mejor legibilidad
             columnas_orden = [
                 'tipo', 'numero', 'fecha', 'titulo', 'organismo', 
                 'identificador', 'codigo_publicacion', 'codigo_hash',
                 'firmantes', 'tiene_anexo_web', 'temas_detectados',
                 'palabras_clave', 'cuentas_interesadas', 'contenido_completo'
             ]
-            df = df[columnas_orden]
+            df = pd.DataFrame({columna: columnas[columna] for columna in columnas_orden})
+            
+            # Columnas con pocos valores distintos: guardarlas como categorías ahorra memoria
+            for columna in ('tipo', 'organismo', 'cuentas_interesadas'):
+                df[columna] = df[columna].astype('category')
             
             # Intentar guardar en diferentes formatos
             try:
                 # 1. Guardar como TSV (Tab-Separated Values)
                 tsv_path = os.path.join(self.output_dir, f"{base_nombre}_documentos.tsv")
-                df.to_csv(tsv_path, 
-                         index=False,
-                         encoding='utf-8-sig',
-                         sep='\t',
-                         quoting=csv.QUOTE_MINIMAL)
+                with open(tsv_path, 'w', encoding='utf-8-sig', newline='', buffering=1024 * 1024) as f:
+                    writer = csv.writer(f, delimiter='\t', quoting=csv.QUOTE_MINIMAL, lineterminator=os.linesep)
+                    writer.writerow(columnas_orden)
+                    # Los valores faltantes se escriben como celdas vacías, igual que to_csv.
+                    # Sólo se copian las columnas que tienen faltantes (astype(object) porque
+                    # las categorías no admiten '' como valor de relleno)
+                    valores = [
+                        (df[columna].astype(object).fillna('') if df[columna].hasnans else df[columna]).tolist()
+                        for columna in columnas_orden
+                    ]
+                    writer.writerows(zip(*valores))
                 logger.info(f"Datos guardados en TSV: {tsv_path}")
             except Exception as e:
                 logger.error(f"Error al guardar TSV: {str(e)}")
@@ -770,7 +1228,7 @@ class BoletinPDFProcessor:
             try:
                 # 2. Guardar como Excel
                 excel_path = os.path.join(self.output_dir, f"{base_nombre}_documentos.xlsx")
-                df.to_excel(excel_path, index=False, engine='openpyxl')
+                df.to_excel(excel_path, index=False, engine=EXCEL_ENGINE)
                 logger.info(f"Datos guardados en Excel: {excel_path}")
             except Exception as e:
                 logger.error(f"Error al guardar Excel: {str(e)}")
@@ -778,14 +1236,26 @@ class BoletinPDFProcessor:
             try:
                 # 3. Guardar JSON (como respaldo)
                 json_path = os.path.join(self.output_dir, f"{base_nombre}_metadata.json")
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, ensure_ascii=False, indent=2)
+                metadata_json = None
+                if orjson:
+                    try:
+                        metadata_json = orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                    except orjson.JSONEncodeError as e:
+                        logger.warning(f"orjson no pudo serializar la metadata, se usa json: {str(e)}")
+                
+                if metadata_json is not None:
+                    with open(json_path, 'wb') as f:
+                        f.write(metadata_json)
+                else:
+                    # json.dump hace muchas escrituras chicas: usar un buffer de 1 MiB
+                    with open(json_path, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                        json.dump(metadata, f, ensure_ascii=False, indent=2)
                 logger.info(f"Metadata guardada en JSON: {json_path}")
             except Exception as e:
                 logger.error(f"Error al guardar JSON: {str(e)}")
             
             # Generar resumen por cuenta
-            self._generar_resumen_por_cuenta(df, base_nombre)
+            self._generar_resumen_por_cuenta(df, base_nombre, filas_por_cuenta)
             
             # Mostrar las primeras filas como verificación
             logger.info("\nPrimeros documentos procesados:")
@@ -795,100 +1265,41 @@ class BoletinPDFProcessor:
             logger.error(f"Error al guardar resultados: {str(e)}")
             raise
 
-    def _generar_resumen_por_cuenta(self, df: pd.DataFrame, base_nombre: str) -> None:
+    def _generar_resumen_por_cuenta(self, df: pd.DataFrame, base_nombre: str,
+                                    filas_por_cuenta: Dict[str, List[int]]) -> None:
         """Genera un resumen Excel y Word por cada cuenta con sus documentos relevantes"""
         try:
-            # Crear directorio para reportes por cuenta
+            # Crear directorio para reportes por cuenta (aunque quede vacío: marca cuál es el último boletín)
             dir_reportes = os.path.join(self.output_dir, f"{base_nombre}_reportes_cuenta")
             os.makedirs(dir_reportes, exist_ok=True)
             
-            # Para cada cuenta
-            for cuenta in self.cuentas.keys():
-                try:
-                    # Filtrar documentos relevantes para esta cuenta
-                    docs_cuenta = df[df['cuentas_interesadas'].str.contains(cuenta, na=False)]
-                    
-                    if not docs_cuenta.empty:
-                        # 1. Guardar reporte Excel
-                        nombre_excel = f"reporte_{cuenta.replace(' ', '_').replace('/', '_')}.xlsx"
-                        ruta_excel = os.path.join(dir_reportes, nombre_excel)
-                        
-                        try:
-                            docs_cuenta.to_excel(ruta_excel, 
-                                              index=False,
-                                              engine='openpyxl')
-                            logger.info(f"Generado reporte Excel para {cuenta} con {len(docs_cuenta)} documentos")
-                        except Exception as e:
-                            logger.warning(f"Error al guardar reporte Excel para {cuenta}: {str(e)}")
-                        
-                        # 2. Generar reporte Word
-                        try:
-                            doc = Document()
-                            
-                            # Título
-                            doc.add_heading(f'Reporte de Boletín Oficial - {cuenta}', 0)
-                            
-                            # Información general
-                            doc.add_paragraph(f'Fecha de generación: {datetime.now().strftime("%d/%m/%Y %H:%M:%S")}')
-                            doc.add_paragraph(f'Total de documentos relevantes: {len(docs_cuenta)}')
-                            doc.add_paragraph()
-                            
-                            # Agregar cada documento
-                            for _, documento in docs_cuenta.iterrows():
-                                # Título del documento
-                                doc.add_heading(f'{documento["tipo"]} {documento["numero"] or "S/N"}', level=1)
-                                
-                                # Metadata básica
-                                p = doc.add_paragraph()
-                                p.add_run('Fecha: ').bold = True
-                                p.add_run(f'{documento["fecha"] or "No especificada"}')
-                                
-                                p = doc.add_paragraph()
-                                p.add_run('Organismo: ').bold = True
-                                p.add_run(f'{documento["organismo"] or "No especificado"}')
-                                
-                                if documento["identificador"]:
-                                    p = doc.add_paragraph()
-                                    p.add_run('Identificador: ').bold = True
-                                    p.add_run(documento["identificador"])
-                                
-                                # Temas y palabras clave
-                                if documento["temas_detectados"]:
-                                    p = doc.add_paragraph()
-                                    p.add_run('Temas detectados: ').bold = True
-                                    p.add_run(documento["temas_detectados"])
-                                
-                                if documento["palabras_clave"]:
-                                    p = doc.add_paragraph()
-                                    p.add_run('Palabras clave: ').bold = True
-                                    p.add_run(documento["palabras_clave"])
-                                
-                                # Título/descripción del documento
-                                if documento["titulo"]:
-                                    doc.add_heading('Descripción', level=2)
-                                    doc.add_paragraph(documento["titulo"])
-                                
-                                # Contenido completo
-                                doc.add_heading('Contenido Completo', level=2)
-                                contenido = documento["contenido_completo"].replace('\\n', '\n')
-                                doc.add_paragraph(contenido)
-                                
-                                # Separador entre documentos
-                                doc.add_paragraph('_' * 50)
-                                doc.add_paragraph()
-                            
-                            # Guardar documento Word
-                            nombre_word = f"reporte_detallado_{cuenta.replace(' ', '_').replace('/', '_')}.docx"
-                            ruta_word = os.path.join(dir_reportes, nombre_word)
-                            doc.save(ruta_word)
-                            logger.info(f"Generado reporte Word detallado para {cuenta}")
-                            
-                        except Exception as e:
-                            logger.warning(f"Error al generar reporte Word para {cuenta}: {str(e)}")
-                
-                except Exception as e:
-                    logger.warning(f"Error procesando cuenta {cuenta}: {str(e)}")
-                    continue
+            # Sólo las cuentas del índice tienen documentos: las demás no generan nada
+            if not filas_por_cuenta:
+                logger.info("Ninguna cuenta tiene documentos relevantes en este boletín")
+                return
+            
+            # Contenido con saltos de línea reales, calculado una sola vez para todas las cuentas
+            contenido_render = df['contenido_completo'].str.replace('\\n', '\n', regex=False)
+            
+            # Todos los reportes de esta ejecución llevan la misma fecha de generación
+            fecha_generacion = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+            
+            # Una tarea por cuenta con documentos relevantes
+            tareas = [
+                (cuenta, df.iloc[filas], contenido_render.iloc[filas], dir_reportes, fecha_generacion)
+                for cuenta, filas in filas_por_cuenta.items()
+            ]
+            
+            # Cada cuenta escribe sus propios archivos: se reparten entre varios procesos
+            # (salvo desde el thread de la GUI, donde no se crean procesos)
+            procesos = min(os.cpu_count() or 1, len(tareas))
+            if procesos <= 1 or threading.current_thread() is not threading.main_thread():
+                for tarea in tareas:
+                    _generar_reportes_cuenta(*tarea)
+            else:
+                logger.info(f"Generando reportes por cuenta con {procesos} procesos...")
+                with multiprocessing.Pool(processes=procesos) as pool:
+                    pool.starmap(_generar_reportes_cuenta, tareas)
         
         except Exception as e:
             logger.error(f"Error al generar resúmenes por cuenta: {str(e)}")
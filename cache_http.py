@@ -0,0 +1,97 @@
+"""
+Descargas HTTP condicionales: se guarda el ETag/Last-Modified y el contenido de cada URL,
+y si el servidor responde 304 (sin cambios) se devuelve la copia local en lugar de bajarla de nuevo.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+CACHE_DIR = os.path.join(".cache", "http")
+
+logger = logging.getLogger(__name__)
+
+# Segundos para conectar y para leer la respuesta: sin esto la descarga podía colgar la GUI
+TIMEOUT = (3, 10)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+def crear_sesion():
+    """Sesión con reintentos y pool de conexiones, que pide el HTML comprimido"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': 'gzip, deflate',
+    })
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def _ruta_cache(url):
+    """Archivo donde se guarda la última respuesta de una URL"""
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.pkl')
+
+def _leer_guardado(url):
+    """Devuelve la última respuesta guardada de la URL, o None"""
+    try:
+        with open(_ruta_cache(url), 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+def _guardar(url, response):
+    """Guarda el contenido y los validadores de una respuesta 200"""
+    guardado = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'headers': dict(response.headers),
+        'encoding': response.encoding,
+        'content': response.content,
+    }
+    if not (guardado['etag'] or guardado['last_modified']):
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Se escribe en un temporal y se reemplaza, para no dejar archivos a medias entre threads
+        fd, temporal = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(guardado, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, _ruta_cache(url))
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudo guardar la copia local de {url}: {str(e)}")
+
+def _respuesta_guardada(url, guardado):
+    """Arma una respuesta 200 con el contenido guardado"""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers = CaseInsensitiveDict(guardado['headers'])
+    response.encoding = guardado['encoding']
+    response._content = guardado['content']
+    return response
+
+def get_con_cache(url, session=None, **kwargs):
+    """GET condicional: si el recurso no cambió (304) devuelve la copia local como respuesta 200"""
+    guardado = _leer_guardado(url)
+
+    headers = dict(kwargs.pop('headers', None) or {})
+    if guardado:
+        if guardado['etag']:
+            headers['If-None-Match'] = guardado['etag']
+        if guardado['last_modified']:
+            headers['If-Modified-Since'] = guardado['last_modified']
+
+    response = (session or requests).get(url, headers=headers, **kwargs)
+
+    if response.status_code == 304 and guardado:
+        return _respuesta_guardada(url, guardado)
+    if response.status_code == 200:
+        _guardar(url, response)
+    return response
@@ -0,0 +1,42 @@
+"""
+Plantillas XML para armar párrafos de Word sin pasar por add_paragraph/add_run de python-docx.
+Los párrafos se escriben como texto y se parsean de una sola vez con lxml.
+"""
+import re
+from typing import Iterable, Optional
+from xml.sax.saxutils import escape
+
+# Caracteres que python-docx convierte en elementos propios dentro de un run
+_SEPARADORES_RUN = re.compile(r'([\t\r\n])')
+
+def run_xml(texto: str, negrita: bool = False) -> str:
+    """Arma el XML de un run igual que python-docx: tabulaciones y saltos como <w:tab/> y <w:br/>"""
+    partes = ['<w:r><w:rPr><w:b/></w:rPr>' if negrita else '<w:r>']
+    for trozo in _SEPARADORES_RUN.split(texto):
+        if trozo == '\t':
+            partes.append('<w:tab/>')
+        elif trozo == '\r' or trozo == '\n':
+            partes.append('<w:br/>')
+        elif trozo:
+            espacio = ' xml:space="preserve"' if len(trozo.strip()) < len(trozo) else ''
+            partes.append(f'<w:t{espacio}>{escape(trozo)}</w:t>')
+    partes.append('</w:r>')
+    return ''.join(partes)
+
+def parrafo_xml(runs: str = '', estilo: Optional[str] = None) -> str:
+    """Arma el XML de un párrafo con el estilo indicado"""
+    if estilo:
+        return f'<w:p><w:pPr><w:pStyle w:val="{estilo}"/></w:pPr>{runs}</w:p>'
+    return f'<w:p>{runs}</w:p>'
+
+def agregar_parrafos_xml(doc, parrafos: Iterable[str]) -> None:
+    """Agrega al final del documento los párrafos ya armados como XML"""
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    cuerpo = parse_xml(f'<w:body {nsdecls("w")}>{"".join(parrafos)}</w:body>')
+
+    # Los párrafos nuevos van antes de la configuración de sección, como en add_paragraph
+    sect_pr = doc.element.body.sectPr
+    for parrafo in list(cuerpo):
+        sect_pr.addprevious(parrafo)
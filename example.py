@@ -1,19 +1,46 @@
 # Importación de las clases necesarias del proyecto
-from rss_reader import RSSReader
+from rss_reader import RSSReader, guardar_fechas_vistas
 from collections import defaultdict
 import re
 import time
 import pandas as pd
 import concurrent.futures
+import multiprocessing
+import threading
+from itertools import zip_longest
+import asyncio
+import feedparser
 from docx import Document
 from docx.shared import Pt
+from docx.oxml.ns import qn
+from docx_xml import run_xml, parrafo_xml, agregar_parrafos_xml
 from datetime import datetime
 import os
+import pickle
 import gspread
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 import logging
 import sys
 
+# Autómata Aho-Corasick para buscar todas las palabras clave en una sola pasada (opcional)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# aiohttp descarga todos los feeds a la vez con una sola sesión (opcional)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# uvloop reemplaza el bucle de asyncio por uno en C sobre libuv (opcional, no disponible en Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,26 +50,26 @@ logging.basicConfig(
     ]
 )
 
+# Directorio donde se guarda la última copia de la hoja de Google Sheets
+CACHE_DIR = ".cache"
+CACHE_SHEETS = os.path.join(CACHE_DIR, "sheets_noticias.pkl")
+
 def cargar_diccionario():
     """Carga los temas y palabras clave del diccionario Excel"""
     try:
         df = pd.read_excel('Diccionario.xlsx', engine='openpyxl')
-        temas = {}
-        
-        # Iterar sobre las filas del DataFrame
-        for _, row in df.iterrows():
-            if pd.notna(row.iloc[0]):  # Si hay tema
-                tema = str(row.iloc[0]).strip()
-                if tema not in temas:
-                    temas[tema] = {
-                        'tema': tema,
-                        'palabras_clave': []
-                    }
-                
-                # Si hay palabra clave, agregarla
-                if len(row) > 1 and pd.notna(row.iloc[1]):
-                    palabra_clave = str(row.iloc[1]).strip().lower()
-                    temas[tema]['palabras_clave'].append(palabra_clave)
+        
+        # Quedarse con las filas que tienen tema (primera columna)
+        df = df[df.iloc[:, 0].notna()]
+        columna_temas = df.iloc[:, 0].astype(str).str.strip()
+        temas = {tema: {'tema': tema, 'palabras_clave': []} for tema in columna_temas}
+        
+        # Agregar las palabras clave (segunda columna) ya normalizadas
+        if df.shape[1] > 1:
+            hay_palabra = df.iloc[:, 1].notna()
+            palabras = df.iloc[:, 1][hay_palabra].astype(str).str.strip().str.lower()
+            for tema, palabra_clave in zip(columna_temas[hay_palabra], palabras):
+                temas[tema]['palabras_clave'].append(palabra_clave)
         
         return temas
     except Exception as e:
@@ -106,32 +133,69 @@ def cargar_noticias_sheets():
             print(f"❌ Error al acceder a la hoja 'Noticias': {str(e)}")
             return []
         
-        print("📥 Leyendo datos...")
+        # La fecha de última modificación (Drive) permite reutilizar la copia local si la hoja no cambió
         try:
-            data = worksheet.get_all_values()
-            print(f"✅ Se leyeron {len(data)} filas de datos")
+            version = spreadsheet.lastUpdateTime
         except Exception as e:
-            print(f"❌ Error al leer los datos: {str(e)}")
-            return []
+            print(f"⚠️ No se pudo consultar la última modificación de la hoja: {str(e)}")
+            version = None
         
-        # Convertir a DataFrame
-        df = pd.DataFrame(data[1:], columns=data[0])  # Asumiendo que la primera fila son los encabezados
+        data = None
+        if version and os.path.exists(CACHE_SHEETS):
+            try:
+                with open(CACHE_SHEETS, 'rb') as f:
+                    version_cache, data_cache = pickle.load(f)
+                if version_cache == version:
+                    data = data_cache
+                    print(f"✅ La hoja no cambió desde la última lectura: se usan {len(data)} filas guardadas")
+            except Exception as e:
+                print(f"⚠️ No se pudo leer la copia local de la hoja: {str(e)}")
+        
+        if data is None:
+            print("📥 Leyendo datos...")
+            try:
+                # Sólo se descargan las columnas de título ('A') y fecha, no la hoja entera
+                encabezados = worksheet.row_values(1)
+                letras = [
+                    rowcol_to_a1(1, encabezados.index(nombre) + 1)[:-1]
+                    for nombre in ('A', 'Fecha')
+                ]
+                titulos, fechas = (
+                    [fila[0] if fila else '' for fila in rango]
+                    for rango in worksheet.batch_get([f"{letra}2:{letra}" for letra in letras])
+                )
+                data = [['A', 'Fecha']] + [list(fila) for fila in zip_longest(titulos, fechas, fillvalue='')]
+                print(f"✅ Se leyeron {len(data)} filas de datos")
+            except Exception as e:
+                print(f"❌ Error al leer los datos: {str(e)}")
+                return []
+            
+            if version:
+                try:
+                    os.makedirs(CACHE_DIR, exist_ok=True)
+                    with open(CACHE_SHEETS, 'wb') as f:
+                        pickle.dump((version, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+                except Exception as e:
+                    print(f"⚠️ No se pudo guardar la copia local de la hoja: {str(e)}")
         
-        # Filtrar por la fecha de hoy
+        # La primera fila son los encabezados: el título está en la columna 'A'
+        encabezados = data[0]
+        col_titulo = encabezados.index('A')
+        col_fecha = encabezados.index('Fecha')
+        
+        # Filtrar por la fecha de hoy y convertir a formato de noticias en una sola pasada
         fecha_hoy = datetime.now().strftime('%d/%m/%Y')
         print(f"📅 Filtrando noticias de hoy ({fecha_hoy})...")
-        df_hoy = df[df['Fecha'] == fecha_hoy]
-        
-        # Convertir a formato de noticias
-        noticias = []
-        for _, row in df_hoy.iterrows():
-            noticia = {
-                'title': row['A'],  # Título en columna A
+        noticias = [
+            {
+                'title': fila[col_titulo],
                 'feed_name': 'whatsapp_group',
-                'published': row['Fecha'],
+                'published': fila[col_fecha],
                 'link': ''  # No hay link disponible
             }
-            noticias.append(noticia)
+            for fila in data[1:]
+            if fila[col_fecha] == fecha_hoy
+        ]
         
         print(f"✅ Google Sheets: {len(noticias)} noticias cargadas de hoy")
         return noticias
@@ -144,6 +208,16 @@ def cargar_noticias_sheets():
         print(traceback.format_exc())
         return []
 
+# Un lector RSS por thread: cada uno conserva su sesión HTTP entre feeds
+_lectores = threading.local()
+
+def _obtener_lector():
+    """Devuelve el lector RSS del thread actual, creándolo la primera vez"""
+    lector = getattr(_lectores, 'lector', None)
+    if lector is None:
+        lector = _lectores.lector = RSSReader()
+    return lector
+
 def procesar_feed(args):
     """Procesa un feed RSS individual"""
     name, url = args
@@ -152,7 +226,7 @@ def procesar_feed(args):
     
     while retry_count < max_retries:
         try:
-            rss_reader = RSSReader()
+            rss_reader = _obtener_lector()
             rss_reader.add_feed(name, url)
             entries = rss_reader.get_feed_entries(name, limit=50)
             if entries:
@@ -170,25 +244,171 @@ def procesar_feed(args):
                 print(f"❌ Error al procesar {name} después de {max_retries} intentos: {str(e)}")
                 return name, []
 
-def clasificar_noticia(noticia, temas):
+# El autómata no acepta la palabra vacía: sus temas se guardan bajo un carácter que no aparece en los títulos
+CLAVE_PALABRA_VACIA = '\0'
+
+def construir_automata(temas):
+    """Construye un autómata Aho-Corasick con todas las palabras clave del diccionario"""
+    if ahocorasick is None:
+        return None
+    
+    # Cada palabra clave guarda dónde aparece: (posición del tema, posición de la palabra en el tema, tema)
+    ubicaciones = defaultdict(list)
+    for indice_tema, tema_data in enumerate(temas.values()):
+        for indice_palabra, palabra_clave in enumerate(tema_data['palabras_clave']):
+            ubicaciones[palabra_clave].append((indice_tema, indice_palabra, tema_data['tema']))
+    
+    automata = ahocorasick.Automaton()
+    for palabra_clave, lugares in ubicaciones.items():
+        automata.add_word(palabra_clave or CLAVE_PALABRA_VACIA, (palabra_clave, lugares))
+    
+    if len(automata) == 0:
+        return None
+    automata.make_automaton()
+    return automata
+
+async def descargar_feed(session, reader, name, url):
+    """Descarga un feed RSS con la sesión compartida y procesa sus entradas"""
+    max_retries = 3
+    loop = asyncio.get_running_loop()
+    
+    for intento in range(1, max_retries + 1):
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    print(f"⚠️ Advertencia: El feed {name} retornó estado {response.status}")
+                contenido = await response.read()
+                # feedparser busca los encabezados en minúsculas (content-type para la codificación)
+                headers = {clave.lower(): valor for clave, valor in response.headers.items()}
+            
+            # feedparser es CPU: se ejecuta en un thread para no frenar las demás descargas
+            entries = await loop.run_in_executor(None, reader.get_entries_from_content, name, contenido, 50, headers)
+            if entries:
+                print(f"✅ {name}: {len(entries)} noticias cargadas")
+            else:
+                print(f"⚠️ Advertencia: No se encontraron entradas en el feed {name}")
+            return name, entries
+        except Exception as e:
+            if intento < max_retries:
+                print(f"⚠️ Intento {intento} fallido para {name}: {str(e)}")
+                await asyncio.sleep(2 ** intento)  # Espera exponencial: 2 s, 4 s
+            else:
+                print(f"❌ Error al procesar {name} después de {max_retries} intentos: {str(e)}")
+                return name, []
+
+def ejecutar_async(corrutina):
+    """Ejecuta una corrutina con uvloop si está instalado, si no con el bucle estándar de asyncio"""
+    if uvloop is not None:
+        return uvloop.run(corrutina)
+    return asyncio.run(corrutina)
+
+async def descargar_feeds(feeds):
+    """Descarga todos los feeds RSS en paralelo reutilizando las conexiones"""
+    reader = RSSReader()
+    connector = aiohttp.TCPConnector(limit=50, limit_per_host=4, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=15)
+    headers = {'User-Agent': feedparser.USER_AGENT}
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+        return await asyncio.gather(*(descargar_feed(session, reader, name, url) for name, url in feeds.items()))
+
+def construir_prefiltro(temas):
+    """Compila un único patrón con todas las palabras clave para descartar títulos sin coincidencias"""
+    palabras = {palabra_clave for tema_data in temas.values() for palabra_clave in tema_data['palabras_clave']}
+    if not palabras:
+        return None
+    return re.compile('|'.join(map(re.escape, sorted(palabras, key=len, reverse=True))))
+
+def clasificar_noticia(noticia, temas, automata=None, prefiltro=None, titulo=None):
     """Clasifica una noticia según los temas del diccionario"""
-    titulo = noticia['title'].lower()
+    # El título puede llegar ya pasado a minúsculas desde main
+    if titulo is None:
+        titulo = noticia['title'].lower()
     temas_encontrados = []
     
-    for tema_data in temas.values():
-        # Por cada palabra clave del tema, verificar si está contenida en el título
-        for palabra_clave in tema_data['palabras_clave']:
-            if palabra_clave in titulo:
-                tema_encontrado = {
-                    'tema': tema_data['tema'],
-                    'palabra_encontrada': palabra_clave
-                }
-                logging.info(f"Noticia: '{noticia['title']}' clasificada en tema: '{tema_data['tema']}' por palabra clave: '{palabra_clave}'")
-                temas_encontrados.append(tema_encontrado)
-                break
+    # Con el autómata se recorre el título una sola vez; sin él, se busca cada palabra
+    if automata is not None:
+        coincidencias = [valor for _, valor in automata.iter(titulo)]
+        # La palabra vacía está contenida en cualquier título, igual que con 'in'
+        vacia = automata.get(CLAVE_PALABRA_VACIA, None)
+        if vacia is not None:
+            coincidencias.append(vacia)
+        
+        # Por cada tema, la palabra encontrada que figura primero en su lista
+        primeras = {}
+        for palabra_clave, lugares in coincidencias:
+            for indice_tema, indice_palabra, tema in lugares:
+                if indice_tema not in primeras or indice_palabra < primeras[indice_tema][0]:
+                    primeras[indice_tema] = (indice_palabra, tema, palabra_clave)
+        encontradas = [primeras[indice_tema][1:] for indice_tema in sorted(primeras)]
+    else:
+        # Si ninguna palabra clave aparece en el título no hace falta recorrer los temas
+        if prefiltro is not None and not prefiltro.search(titulo):
+            return temas_encontrados
+        
+        encontradas = []
+        for tema_data in temas.values():
+            # Por cada palabra clave del tema, verificar si está contenida en el título
+            for palabra_clave in tema_data['palabras_clave']:
+                if palabra_clave in titulo:
+                    encontradas.append((tema_data['tema'], palabra_clave))
+                    break
+    
+    for tema, palabra_clave in encontradas:
+        temas_encontrados.append({
+            'tema': tema,
+            'palabra_encontrada': palabra_clave
+        })
+        # En DEBUG y con argumentos diferidos: con el nivel INFO el mensaje ni se arma
+        logging.debug("Noticia: '%s' clasificada en tema: '%s' por palabra clave: '%s'",
+                      noticia['title'], tema, palabra_clave)
     
     return temas_encontrados
 
+# Títulos por tarea al clasificar en paralelo: con menos, crear los procesos cuesta más que clasificar
+TITULOS_POR_LOTE = 5000
+
+# Con menos cuentas, arrancar los procesos cuesta más de lo que ahorran
+# (en Windows cada proceso vuelve a importar todos los módulos)
+MIN_CUENTAS_POR_PROCESOS = 8
+
+# Temas, autómata y prefiltro de cada proceso clasificador (se reciben una sola vez al iniciarlo)
+_clasificador = None
+
+def _iniciar_clasificador(temas, automata, prefiltro):
+    """Guarda en el proceso las estructuras de búsqueda para todos sus lotes"""
+    global _clasificador
+    _clasificador = (temas, automata, prefiltro)
+
+def _clasificar_lote(lote, clasificador=None):
+    """Clasifica un lote de pares (título, título en minúsculas)"""
+    temas, automata, prefiltro = clasificador or _clasificador
+    return [
+        clasificar_noticia({'title': titulo}, temas, automata, prefiltro, titulo_minuscula)
+        for titulo, titulo_minuscula in lote
+    ]
+
+def clasificar_titulos(titulos_minuscula, temas, automata=None, prefiltro=None):
+    """Clasifica cada título distinto; con muchos títulos reparte los lotes entre procesos"""
+    pares = list(titulos_minuscula.items())
+    lotes = [pares[i:i + TITULOS_POR_LOTE] for i in range(0, len(pares), TITULOS_POR_LOTE)]
+    procesos = min(os.cpu_count() or 1, len(lotes))
+    
+    # Desde la GUI main corre en un thread: ahí no se crean procesos (sería un fork del proceso de Tk con varios threads)
+    if procesos <= 1 or threading.current_thread() is not threading.main_thread():
+        resultados = [_clasificar_lote(lote, (temas, automata, prefiltro)) for lote in lotes]
+    else:
+        print(f"🔄 Clasificando {len(pares)} títulos con {procesos} procesos...")
+        with multiprocessing.Pool(processes=procesos, initializer=_iniciar_clasificador,
+                                  initargs=(temas, automata, prefiltro)) as pool:
+            resultados = pool.map(_clasificar_lote, lotes)
+    
+    # Los resultados llegan en el orden de los lotes
+    return {
+        titulo: temas_encontrados
+        for lote, resultados_lote in zip(lotes, resultados)
+        for (titulo, _), temas_encontrados in zip(lote, resultados_lote)
+    }
+
 def generar_lista_medios(feeds):
     """Genera una lista formateada de los medios utilizados"""
     medios = {
@@ -261,8 +481,7 @@ def guardar_en_word(noticias_por_tema, total_noticias, tiempo_total, feeds):
     # Agregar lista de medios consultados
     doc.add_heading('Medios consultados:', level=1)
     medios_list = generar_lista_medios(feeds)
-    for medio in medios_list:
-        doc.add_paragraph(f'• {medio}')
+    agregar_parrafos_xml(doc, [parrafo_xml(run_xml(f'• {medio}')) for medio in medios_list])
     
     # Agregar noticias por tema
     for tema, noticias in noticias_por_tema.items():
@@ -270,14 +489,16 @@ def guardar_en_word(noticias_por_tema, total_noticias, tiempo_total, feeds):
             # Agregar encabezado del tema
             doc.add_heading(f'{tema} ({len(noticias)} noticias)', level=1)
             
-            # Agregar cada noticia
-            for noticia in noticias:
-                p = doc.add_paragraph()
-                p.add_run(f'• {noticia["title"]}').bold = True
-                p.add_run(f'\n  {noticia["feed_name"]} - {noticia.get("published", "Fecha no disponible")}')
-                p.add_run(f'\n  Palabra clave encontrada: {noticia["palabra_encontrada"]}')
-                p.add_run(f'\n  {noticia["link"]}')
-                doc.add_paragraph()  # Espacio entre noticias
+            # Las noticias se arman como XML y se agregan juntas, seguidas de un párrafo vacío
+            agregar_parrafos_xml(doc, [
+                parrafo_xml(
+                    run_xml(f'• {noticia["title"]}', negrita=True)
+                    + run_xml(f'\n  {noticia["feed_name"]} - {noticia.get("published", "Fecha no disponible")}')
+                    + run_xml(f'\n  Palabra clave encontrada: {noticia["palabra_encontrada"]}')
+                    + run_xml(f'\n  {noticia["link"]}')
+                ) + parrafo_xml()
+                for noticia in noticias
+            ])
     
     # Crear directorio si no existe
     os.makedirs('Reportes', exist_ok=True)
@@ -312,38 +533,22 @@ def cargar_cuentas():
             
         logging.info(f"Columnas encontradas: {df.columns.tolist()}")
         
-        # Diccionario para almacenar la relación empresa -> temas
-        cuentas = {}
+        # Quedarse con las filas que tienen empresa
+        df = df[df['Empresa'].notna()]
+        empresas = df['Empresa'].astype(str).str.strip()
+        cuentas = {empresa: {'nombre': empresa, 'temas': []} for empresa in empresas}
         
-        # Procesar cada fila (empresa)
-        for idx, row in df.iterrows():
-            try:
-                empresa = row['Empresa']
-                
-                # Si no hay empresa, saltamos
-                if pd.isna(empresa):
-                    continue
-                    
-                empresa = str(empresa).strip()
-                
-                # Inicializar la empresa en el diccionario
-                if empresa not in cuentas:
-                    cuentas[empresa] = {
-                        'nombre': empresa,
-                        'temas': []
-                    }
-                
-                # Procesar cada columna de temáticas
-                for columna in df.columns:
-                    if columna != 'Empresa' and pd.notna(row[columna]):
-                        tema = str(row[columna]).strip()
-                        if tema and tema not in cuentas[empresa]['temas']:
-                            logging.info(f"Empresa: {empresa} - Tema encontrado: '{tema}'")
-                            cuentas[empresa]['temas'].append(tema)
-                            
-            except Exception as row_error:
-                logging.error(f"Error procesando fila {idx}: {str(row_error)}")
-                continue
+        # Apilar las columnas de temáticas fila por fila (descarta celdas vacías)
+        temas_df = df.drop(columns='Empresa')
+        temas_df.index = empresas
+        temas = temas_df.stack().dropna().astype(str).str.strip()
+        temas = temas[temas != '']
+        
+        # Temas sin duplicados, respetando el orden de aparición
+        for empresa, temas_empresa in temas.groupby(level=0, sort=False):
+            cuentas[empresa]['temas'] = list(dict.fromkeys(temas_empresa))
+            for tema in cuentas[empresa]['temas']:
+                logging.info(f"Empresa: {empresa} - Tema encontrado: '{tema}'")
         
         return cuentas
         
@@ -354,7 +559,19 @@ def cargar_cuentas():
         logging.error(traceback.format_exc())
         return {}
 
-def guardar_reporte_cuenta(cuenta, temas_cuenta, noticias_por_tema, tiempo_total, feeds):
+def buscar_ultima_carpeta_bo(dir_bo="datos_boletin"):
+    """Devuelve la carpeta más reciente de reportes por cuenta del Boletín Oficial, o None"""
+    if not os.path.isdir(dir_bo):
+        return None
+    # scandir trae el tipo de cada entrada en la misma lectura del directorio
+    with os.scandir(dir_bo) as entradas:
+        ultima_carpeta = max(
+            (e.name for e in entradas if e.name.endswith('_reportes_cuenta') and e.is_dir()),
+            default=None
+        )
+    return os.path.join(dir_bo, ultima_carpeta) if ultima_carpeta else None
+
+def guardar_reporte_cuenta(cuenta, temas_cuenta, noticias_por_tema, tiempo_total, feeds, carpeta_bo=None):
     """Guarda un reporte Word para una cuenta específica"""
     try:
         # Crear directorio para reportes
@@ -380,42 +597,55 @@ def guardar_reporte_cuenta(cuenta, temas_cuenta, noticias_por_tema, tiempo_total
                 doc.add_heading(f'📌 {tema.upper()}', level=1)
                 doc.add_paragraph('_' * 80)
                 
+                parrafos = []
                 for noticia in noticias_por_tema[tema]:
-                    p = doc.add_paragraph()
-                    p.add_run(f'• {noticia["title"]}').bold = True
-                    p.add_run(f'\n  {noticia["feed_name"]} - {noticia["published"]}')
+                    runs = [
+                        run_xml(f'• {noticia["title"]}', negrita=True),
+                        run_xml(f'\n  {noticia["feed_name"]} - {noticia["published"]}'),
+                    ]
                     if "palabra_encontrada" in noticia:
-                        p.add_run(f'\n  Palabra clave encontrada: {noticia["palabra_encontrada"]}')
+                        runs.append(run_xml(f'\n  Palabra clave encontrada: {noticia["palabra_encontrada"]}'))
                     if "link" in noticia:
-                        p.add_run(f'\n  {noticia["link"]}')
-                    doc.add_paragraph()
+                        runs.append(run_xml(f'\n  {noticia["link"]}'))
+                    parrafos.append(parrafo_xml(''.join(runs)))
+                    parrafos.append(parrafo_xml())
+                agregar_parrafos_xml(doc, parrafos)
         
         # Agregar contenido del Boletín Oficial si existe
         try:
-            # Buscar el último reporte del BO
-            dir_bo = "datos_boletin"
-            if os.path.exists(dir_bo):
-                # Encontrar la última carpeta de reportes
-                carpetas_reportes = [d for d in os.listdir(dir_bo) if d.endswith('_reportes_cuenta')]
-                if carpetas_reportes:
-                    ultima_carpeta = sorted(carpetas_reportes)[-1]
-                    ruta_reporte_bo = os.path.join(dir_bo, ultima_carpeta, f"reporte_detallado_{cuenta.replace(' ', '_').replace('/', '_')}.docx")
+            # La carpeta del último reporte del BO se busca una sola vez en main
+            if carpeta_bo is None:
+                carpeta_bo = buscar_ultima_carpeta_bo()
+            if carpeta_bo:
+                base_reporte_bo = os.path.join(carpeta_bo, f"reporte_detallado_{cuenta.replace(' ', '_').replace('/', '_')}")
+                ruta_reporte_bo = f"{base_reporte_bo}.docx"
+                
+                if os.path.exists(ruta_reporte_bo):
+                    # Agregar separador
+                    doc.add_heading('=' * 50, level=1)
+                    doc.add_heading('DOCUMENTOS DEL BOLETÍN OFICIAL', level=1)
+                    doc.add_paragraph('_' * 80)
                     
-                    if os.path.exists(ruta_reporte_bo):
-                        # Agregar separador
-                        doc.add_heading('=' * 50, level=1)
-                        doc.add_heading('DOCUMENTOS DEL BOLETÍN OFICIAL', level=1)
-                        doc.add_paragraph('_' * 80)
-                        
+                    # Los reportes largos vienen divididos en partes: _parte2, _parte3, ...
+                    rutas_bo = [ruta_reporte_bo]
+                    while os.path.exists(f"{base_reporte_bo}_parte{len(rutas_bo) + 1}.docx"):
+                        rutas_bo.append(f"{base_reporte_bo}_parte{len(rutas_bo) + 1}.docx")
+                    
+                    # El contenido va antes de la configuración de sección del reporte, como en add_paragraph
+                    sect_pr = doc.element.body.sectPr
+                    for ruta_parte in rutas_bo:
                         # Cargar el documento del BO
-                        doc_bo = Document(ruta_reporte_bo)
+                        doc_bo = Document(ruta_parte)
                         
                         # Copiar el contenido desde después del título principal
                         for element in list(doc_bo.element.body)[2:]:  # Saltar título y fecha
-                            doc.element.body.append(element)
-                            
-                        doc.add_paragraph(f"\nInformación extraída del reporte: {ruta_reporte_bo}")
+                            # Cada parte trae su propio sectPr: el reporte ya tiene el suyo
+                            if element.tag == qn('w:sectPr'):
+                                continue
+                            sect_pr.addprevious(element)
                         
+                    doc.add_paragraph(f"\nInformación extraída del reporte: {ruta_reporte_bo}")
+                    
         except Exception as e:
             doc.add_paragraph(f"\nNota: No se pudo incluir información del Boletín Oficial. Error: {str(e)}")
         
@@ -431,38 +661,47 @@ def guardar_reporte_cuenta(cuenta, temas_cuenta, noticias_por_tema, tiempo_total
         print(f"❌ Error al generar reporte para {cuenta}: {str(e)}")
         return False
 
+def cargar_noticias_feeds(feeds):
+    """Descarga todos los feeds RSS en paralelo y devuelve sus noticias"""
+    noticias = []
+    
+    print("\n🔄 Procesando feeds en paralelo...")
+    if aiohttp is not None:
+        # Todas las descargas a la vez, con una sesión HTTP compartida
+        for name, entries in ejecutar_async(descargar_feeds(feeds)):
+            for entry in entries:
+                entry['feed_name'] = name
+                noticias.append(entry)
+    else:
+        # Los threads pasan casi todo el tiempo esperando la red: varios por CPU, sin superar la cantidad de feeds
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(len(feeds), (os.cpu_count() or 1) + 4))
+        try:
+            futures = [executor.submit(procesar_feed, (name, url)) for name, url in feeds.items()]
+            
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    name, entries = future.result()
+                    if entries:
+                        for entry in entries:
+                            entry['feed_name'] = name
+                            noticias.append(entry)
+                except Exception as e:
+                    print(f"❌ Error inesperado: {str(e)}")
+        finally:
+            print("🔄 Cerrando threads...")
+            executor.shutdown(wait=True)
+            print("✅ Threads cerrados correctamente")
+    
+    # Las fechas evaluadas de todos los feeds se escriben en disco una sola vez
+    guardar_fechas_vistas()
+    return noticias
+
 def main():
     print("🔄 Iniciando lectura de feeds RSS...")
     
     # Crear carpeta principal de reportes si no existe
     os.makedirs('Reportes', exist_ok=True)
     
-    # Cargar cuentas y sus temas
-    print("\n📊 Cargando información de cuentas...")
-    cuentas = cargar_cuentas()
-    if not cuentas:
-        print("❌ No se pudo cargar el archivo de cuentas. Saliendo...")
-        return
-    
-    print(f"✅ Se cargaron {len(cuentas)} cuentas")
-    print("\nCuentas y temas cargados:")
-    for cuenta, data in cuentas.items():
-        print(f"• {cuenta}: {len(data['temas'])} temas")
-        for tema in data['temas']:
-            print(f"  - {tema}")
-    
-    # Cargar temas del diccionario
-    print("\n📚 Cargando diccionario de temas...")
-    temas = cargar_diccionario()
-    if not temas:
-        print("❌ No se pudo cargar el diccionario de temas. Saliendo...")
-        return
-    
-    print(f"✅ Se cargaron {len(temas)} temas del diccionario")
-    print("\nTemas cargados:")
-    for tema, data in temas.items():
-        print(f"• {tema} ({len(data['palabras_clave'])} palabras clave)")
-    
     # Configurar las fuentes RSS
     feeds = {
         'infobae': 'https://www.infobae.com/feeds/rss/',
@@ -527,32 +766,46 @@ def main():
         'lavoz_opinion': 'http://archivo.lavoz.com.ar/RSS/RSS.asp?categoria=214',
     }
     
-    all_news = []
     start_time = time.time()
     
-    # Cargar noticias de Google Sheets
-    sheet_news = cargar_noticias_sheets()
-    all_news.extend(sheet_news)
+    # Las cargas no dependen entre sí: los Excel y la hoja de Google se leen en threads
+    # mientras se descargan los feeds
+    print("\n📊 Cargando información de cuentas...")
+    print("\n📚 Cargando diccionario de temas...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as cargas:
+        futuro_cuentas = cargas.submit(cargar_cuentas)
+        futuro_temas = cargas.submit(cargar_diccionario)
+        futuro_sheets = cargas.submit(cargar_noticias_sheets)
+        feed_news = cargar_noticias_feeds(feeds)
     
-    # Procesar feeds en paralelo
-    print("\n🔄 Procesando feeds en paralelo...")
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
-    try:
-        futures = [executor.submit(procesar_feed, (name, url)) for name, url in feeds.items()]
-        
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                name, entries = future.result()
-                if entries:
-                    for entry in entries:
-                        entry['feed_name'] = name
-                        all_news.append(entry)
-            except Exception as e:
-                print(f"❌ Error inesperado: {str(e)}")
-    finally:
-        print("🔄 Cerrando threads...")
-        executor.shutdown(wait=True)
-        print("✅ Threads cerrados correctamente")
+    # Cuentas y temas
+    cuentas = futuro_cuentas.result()
+    if not cuentas:
+        print("❌ No se pudo cargar el archivo de cuentas. Saliendo...")
+        return
+    
+    print(f"✅ Se cargaron {len(cuentas)} cuentas")
+    print("\nCuentas y temas cargados:")
+    for cuenta, data in cuentas.items():
+        print(f"• {cuenta}: {len(data['temas'])} temas")
+        for tema in data['temas']:
+            print(f"  - {tema}")
+    
+    temas = futuro_temas.result()
+    if not temas:
+        print("❌ No se pudo cargar el diccionario de temas. Saliendo...")
+        return
+    
+    print(f"✅ Se cargaron {len(temas)} temas del diccionario")
+    print("\nTemas cargados:")
+    for tema, data in temas.items():
+        print(f"• {tema} ({len(data['palabras_clave'])} palabras clave)")
+    
+    # El autómata (o, sin pyahocorasick, el patrón de prefiltro) se arma una sola vez
+    automata = construir_automata(temas)
+    prefiltro = construir_prefiltro(temas) if automata is None else None
+    
+    all_news = futuro_sheets.result() + feed_news
     
     tiempo_total = time.time() - start_time
     print(f"\n✨ Carga completada en {tiempo_total:.2f} segundos")
@@ -562,9 +815,25 @@ def main():
     noticias_por_tema = defaultdict(list)
     total_noticias_clasificadas = 0
     
+    # Cada título distinto se pasa a minúsculas una sola vez (los feeds repiten noticias)
+    titulos_minuscula = {titulo: titulo.lower() for titulo in dict.fromkeys(noticia['title'] for noticia in all_news)}
+    
+    # Descartar las noticias repetidas entre feeds (mismo título), conservando la primera
+    noticias_unicas = {}
+    for noticia in all_news:
+        noticias_unicas.setdefault(titulos_minuscula[noticia['title']].strip(), noticia)
+    if len(noticias_unicas) < len(all_news):
+        print(f"🔁 Se descartaron {len(all_news) - len(noticias_unicas)} noticias repetidas")
+    all_news = list(noticias_unicas.values())
+    
+    # Cada título distinto se clasifica una sola vez
+    clasificacion = clasificar_titulos(
+        {noticia['title']: titulos_minuscula[noticia['title']] for noticia in all_news},
+        temas, automata, prefiltro
+    )
+    
     for noticia in all_news:
-        temas_noticia = clasificar_noticia(noticia, temas)
-        for tema_info in temas_noticia:
+        for tema_info in clasificacion[noticia['title']]:
             tema = tema_info['tema']
             noticia['palabra_encontrada'] = tema_info['palabra_encontrada']
             noticias_por_tema[tema].append(noticia)
@@ -593,11 +862,30 @@ def main():
     
     # Generar reportes por cuenta
     print("\n📝 Generando reportes por cuenta...")
-    reportes_generados = 0
-    for cuenta, data in cuentas.items():
-        print(f"\n📌 Procesando cuenta: {cuenta}")
-        guardar_reporte_cuenta(cuenta, data['temas'], noticias_por_tema, tiempo_total, feeds)
-        reportes_generados += 1
+    carpeta_bo = buscar_ultima_carpeta_bo()
+    # Cada cuenta recibe sólo las noticias de sus temas
+    tareas = [
+        (cuenta, data['temas'],
+         {tema: noticias_por_tema[tema] for tema in data['temas'] if tema in noticias_por_tema},
+         tiempo_total, feeds, carpeta_bo)
+        for cuenta, data in cuentas.items()
+    ]
+    
+    # Cada cuenta escribe su propio documento: con muchas cuentas se reparten entre varios procesos.
+    # Desde la GUI main corre en un thread y no se crean procesos (sería un fork del proceso de Tk con varios threads)
+    procesos = min(os.cpu_count() or 1, len(tareas))
+    if (procesos <= 1 or len(tareas) < MIN_CUENTAS_POR_PROCESOS
+            or threading.current_thread() is not threading.main_thread()):
+        resultados = []
+        for tarea in tareas:
+            print(f"\n📌 Procesando cuenta: {tarea[0]}")
+            resultados.append(guardar_reporte_cuenta(*tarea))
+    else:
+        print(f"🔄 Generando {len(tareas)} reportes con {procesos} procesos...")
+        with multiprocessing.Pool(processes=procesos) as pool:
+            resultados = pool.starmap(guardar_reporte_cuenta, tareas)
+    # Sólo cuentan los reportes que se pudieron guardar
+    reportes_generados = sum(1 for generado in resultados if generado)
     
     print(f"\n✨ Proceso completado. Se generaron reportes para {reportes_generados} cuentas con noticias relevantes.")
 
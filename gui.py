@@ -1,9 +1,33 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
+import subprocess
+import sys
 from datetime import datetime
 from example import main as process_news
 import threading
+from collections import deque
+
+# Cada cuántos milisegundos se vuelcan los mensajes pendientes en el log
+LOG_INTERVALO_MS = 100
+# Líneas que se conservan en el área de log
+LOG_MAX_LINEAS = 1000
+
+# Último conteo de reportes por carpeta, junto con la fecha de modificación de la carpeta
+_conteo_reportes = {}
+
+def contar_reportes(reports_dir):
+    """Cuenta los .docx de la carpeta; si la carpeta no cambió desde el último conteo, lo reutiliza"""
+    mtime = os.stat(reports_dir).st_mtime_ns
+    guardado = _conteo_reportes.get(reports_dir)
+    if guardado and guardado[0] == mtime:
+        return guardado[1]
+    
+    # scandir trae los nombres sin hacer un stat por archivo
+    with os.scandir(reports_dir) as entradas:
+        cantidad = sum(1 for entrada in entradas if entrada.name.endswith('.docx'))
+    _conteo_reportes[reports_dir] = (mtime, cantidad)
+    return cantidad
 
 class NewsAnalyzerGUI:
     def __init__(self, root):
@@ -118,11 +142,28 @@ class NewsAnalyzerGUI:
         self.main_frame.columnconfigure(1, weight=1)
         self.main_frame.rowconfigure(3, weight=1)
         
+        # Mensajes pendientes de mostrar: se insertan todos juntos cada LOG_INTERVALO_MS
+        self._log_queue = deque()
+        self._log_lock = threading.Lock()
+        self._schedule_flush()
+        
     def log(self, message):
-        """Agrega un mensaje al área de log"""
+        """Agrega un mensaje al área de log (se muestra en el próximo volcado)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
+        with self._log_lock:
+            self._log_queue.append(f"[{timestamp}] {message}\n")
+    
+    def _schedule_flush(self):
+        """Inserta los mensajes pendientes de una sola vez y vuelve a programarse"""
+        with self._log_lock:
+            pendientes = ''.join(self._log_queue)
+            self._log_queue.clear()
+        if pendientes:
+            self.log_text.insert(tk.END, pendientes)
+            # Se descartan las líneas más viejas para acotar la memoria del widget
+            self.log_text.delete('1.0', f'end - {LOG_MAX_LINEAS} lines')
+            self.log_text.see(tk.END)
+        self.root.after(LOG_INTERVALO_MS, self._schedule_flush)
         
     def process_news(self):
         """Inicia el procesamiento de noticias en un hilo separado"""
@@ -157,12 +198,26 @@ class NewsAnalyzerGUI:
         messagebox.showerror("Error", f"Error en el procesamiento: {error_message}")
     
     def view_reports(self):
-        """Abre el directorio de reportes"""
-        reports_dir = "Reportes"
-        if os.path.exists(reports_dir):
-            os.startfile(reports_dir)
-        else:
-            messagebox.showwarning("Aviso", "No hay reportes generados todavía")
+        """Abre el directorio de reportes en un hilo aparte, para no trabar la interfaz"""
+        reports_dir = os.path.abspath("Reportes")
+        
+        def open_reports():
+            try:
+                os.stat(reports_dir)
+            except FileNotFoundError:
+                self.root.after(0, lambda: messagebox.showwarning("Aviso", "No hay reportes generados todavía"))
+                return
+            try:
+                if sys.platform == 'win32':
+                    os.startfile(reports_dir)
+                else:
+                    subprocess.Popen(['open' if sys.platform == 'darwin' else 'xdg-open', reports_dir])
+            except OSError as e:
+                self.log(f"No se pudo abrir la carpeta de reportes: {e}")
+        
+        thread = threading.Thread(target=open_reports)
+        thread.daemon = True
+        thread.start()
     
     def show_config(self):
         """Muestra la ventana de configuración"""
@@ -191,7 +246,7 @@ class NewsAnalyzerGUI:
         today = datetime.now().strftime("%Y%m%d")
         reports_dir = os.path.join("Reportes", today)
         if os.path.exists(reports_dir):
-            reports_count = len([f for f in os.listdir(reports_dir) if f.endswith('.docx')])
+            reports_count = contar_reportes(reports_dir)
             self.reports_count_label['text'] = f"Reportes generados hoy: {reports_count}"
 
 def main():
@@ -0,0 +1,132 @@
+"""
+Lectura de la tabla que necesitan los scrapers, sin armar el resto de la página.
+Con lxml la página se recorre con iterparse y la lectura se corta apenas termina la tabla;
+la codificación se elige igual que BeautifulSoup con lxml, así el texto extraído no cambia.
+Sin lxml, BeautifulSoup con html.parser arma sólo las tablas (y los h1, si hace falta ubicar un encabezado).
+"""
+import io
+from collections import namedtuple
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
+
+# lxml analiza el HTML en C; BeautifulSoup con html.parser queda como alternativa
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# Celda de una fila: th o td, texto (como get_text(strip=True)), colspan y primer enlace con href (o None)
+Celda = namedtuple('Celda', ['tag', 'texto', 'colspan', 'enlace'])
+
+def _eventos_html(content, events=('start', 'end')):
+    """Devuelve el iterador de iterparse sobre los bytes de la página, o None si lxml no puede leerlos"""
+    # Se prueban las mismas codificaciones, y en el mismo orden, que BeautifulSoup con lxml
+    detector = EncodingDetector(content, is_html=True)
+    for encoding in detector.encodings:
+        try:
+            return etree.iterparse(io.BytesIO(detector.markup), events=events, html=True, encoding=encoding)
+        except LookupError:
+            continue  # codificación que lxml no conoce
+    return None
+
+# Texto que get_text de BeautifulSoup deja afuera: scripts, estilos, plantillas y anotaciones ruby
+_TEXTOS_VISIBLES = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template or ancestor::rt or ancestor::rp)]',
+    smart_strings=False,
+) if etree is not None else None
+
+def texto_lxml(elemento):
+    """Equivale a get_text(strip=True) de BeautifulSoup, pero el recorrido del texto lo hace libxml2"""
+    return ''.join(texto.strip() for texto in _TEXTOS_VISIBLES(elemento))
+
+def _texto_unico(elemento):
+    """Equivale a .string de BeautifulSoup: el texto si el elemento tiene un solo hijo, si no None"""
+    while True:
+        hijos = len(elemento) + bool(elemento.text) + sum(1 for hijo in elemento if hijo.tail)
+        if hijos != 1:
+            return None
+        if elemento.text:
+            return elemento.text
+        elemento = elemento[0]
+
+def _tabla_lxml(content, encabezado):
+    """Recorre la página hasta completar la primera tabla (la primera después del h1 encabezado, si se indica).
+    Devuelve (si apareció el encabezado, tabla o None)"""
+    hay_encabezado = encabezado is None
+    eventos = _eventos_html(content)
+    if eventos is None:
+        return hay_encabezado, None
+
+    tabla = None
+    h1_abiertos = 0
+    try:
+        for evento, elemento in eventos:
+            if evento == 'start':
+                if elemento.tag == 'h1':
+                    h1_abiertos += 1
+                elif hay_encabezado and tabla is None and elemento.tag == 'table':
+                    tabla = elemento
+            elif elemento is tabla:
+                # La tabla está completa: no hace falta seguir leyendo
+                return hay_encabezado, tabla
+            elif tabla is None:
+                if elemento.tag == 'h1':
+                    h1_abiertos -= 1
+                    if not hay_encabezado and _texto_unico(elemento) == encabezado:
+                        hay_encabezado = True
+                # Lo ya recorrido no se usa (el contenido de un h1 se guarda hasta revisar su texto)
+                if h1_abiertos == 0:
+                    elemento.clear()
+    except etree.XMLSyntaxError:
+        # libxml2 no pudo leer el documento: BeautifulSoup con lxml tampoco encontraría la tabla
+        pass
+    return hay_encabezado, None
+
+def _filas_lxml(tabla):
+    """Celdas (Celda) de cada fila de la tabla"""
+    filas = []
+    for fila in tabla.iter('tr'):
+        celdas = []
+        for celda in fila.iter('th', 'td'):
+            enlace = celda.find('.//a[@href]')
+            celdas.append(Celda(celda.tag, texto_lxml(celda), celda.get('colspan'),
+                                enlace.get('href') if enlace is not None else None))
+        filas.append(celdas)
+    return filas
+
+# Sin lxml, BeautifulSoup arma sólo las tablas, o los encabezados h1 (para ubicar la tabla) y las tablas
+_SOLO_TABLAS = SoupStrainer('table')
+_ENCABEZADOS_Y_TABLAS = SoupStrainer(['h1', 'table'])
+
+def _tabla_bs4(content, encabezado):
+    """Lo mismo que _tabla_lxml, con BeautifulSoup"""
+    if encabezado is None:
+        soup = BeautifulSoup(content, 'html.parser', parse_only=_SOLO_TABLAS)
+        return True, soup.find('table')
+    soup = BeautifulSoup(content, 'html.parser', parse_only=_ENCABEZADOS_Y_TABLAS)
+    h1 = soup.find('h1', string=encabezado)
+    if h1 is None:
+        return False, None
+    return True, h1.find_next('table')
+
+def _filas_bs4(tabla):
+    """Lo mismo que _filas_lxml, para una tabla de BeautifulSoup"""
+    filas = []
+    for fila in tabla.find_all('tr'):
+        celdas = []
+        for celda in fila.find_all(['th', 'td']):
+            enlace = celda.find('a', href=True)
+            celdas.append(Celda(celda.name, celda.get_text(strip=True), celda.get('colspan'),
+                                enlace['href'] if enlace else None))
+        filas.append(celdas)
+    return filas
+
+def leer_tabla(content, encabezado=None):
+    """Lee la primera tabla de la página, o la primera que sigue al h1 cuyo texto es encabezado.
+    Devuelve (si apareció el encabezado, filas o None si no hay tabla); cada fila es una lista de Celda"""
+    if etree is None:
+        hay_encabezado, tabla = _tabla_bs4(content, encabezado)
+        return hay_encabezado, _filas_bs4(tabla) if tabla is not None else None
+    hay_encabezado, tabla = _tabla_lxml(content, encabezado)
+    return hay_encabezado, _filas_lxml(tabla) if tabla is not None else None
@@ -5,8 +5,88 @@
 import feedparser
 from datetime import datetime, timedelta
 from dateutil import parser
+from email.utils import parsedate_to_datetime
 import time
-import pandas as pd
+import csv
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cache_http import get_con_cache
+import logging
+import pickle
+import tempfile
+import threading
+
+# Cada noticia agregada se registra en DEBUG: en una ejecución normal no se escribe nada por entrada
+logger = logging.getLogger(__name__)
+
+# Feeds ya descargados y analizados en este proceso: URL -> (momento, feed).
+# Dentro del TTL se devuelven sin volver a la red (p. ej. si se procesa dos veces seguidas)
+FEED_TTL = 300
+_feed_cache = {}
+
+def obtener_feed(url, session=None, ttl=FEED_TTL, **kwargs):
+    """Descarga y analiza un feed, reutilizando el resultado si tiene menos de ttl segundos"""
+    ahora = time.monotonic()
+    guardado = _feed_cache.get(url)
+    if guardado and ahora - guardado[0] < ttl:
+        return guardado[1]
+    
+    # Descarga condicional: si el feed no cambió se usa la copia local
+    response = get_con_cache(url, session, **kwargs)
+    # feedparser busca los encabezados en minúsculas (content-type para la codificación)
+    headers = {clave.lower(): valor for clave, valor in response.headers.items()}
+    feed = feedparser.parse(response.content, response_headers=headers)
+    # Como feedparser.parse(url), el resultado lleva el estado HTTP
+    feed['status'] = response.status_code
+    if response.status_code == 200:
+        _feed_cache[url] = (ahora, feed)
+    return feed
+
+# Fechas de publicación ya evaluadas hoy (texto de la fecha -> si es del día). Se guardan en disco
+# una vez por ejecución, para que las siguientes del mismo día no vuelvan a parsear las mismas entradas
+FECHAS_VISTAS_PATH = os.path.join(".cache", "fechas_vistas.pkl")
+_fechas_vistas = {'dia': None, 'fechas': {}, 'nuevas': False}
+_fechas_vistas_lock = threading.Lock()
+
+def _cargar_fechas_vistas(today):
+    """Devuelve las fechas evaluadas hoy; lo guardado en días anteriores se descarta"""
+    with _fechas_vistas_lock:
+        if _fechas_vistas['dia'] != today:
+            try:
+                with open(FECHAS_VISTAS_PATH, 'rb') as f:
+                    guardado = pickle.load(f)
+            except Exception:
+                guardado = None
+            fechas = guardado['fechas'] if guardado and guardado.get('dia') == today else {}
+            _fechas_vistas.update(dia=today, fechas=fechas, nuevas=False)
+        return _fechas_vistas['fechas']
+
+def _marcar_fechas_nuevas():
+    """Indica que hay fechas evaluadas que todavía no se guardaron"""
+    with _fechas_vistas_lock:
+        _fechas_vistas['nuevas'] = True
+
+def guardar_fechas_vistas():
+    """Guarda en disco las fechas evaluadas hoy, si hubo alguna nueva desde la última vez"""
+    with _fechas_vistas_lock:
+        if not _fechas_vistas['nuevas']:
+            return
+        _fechas_vistas['nuevas'] = False
+        # dict() copia en una sola operación, aunque otro thread esté agregando fechas
+        datos = {'dia': _fechas_vistas['dia'], 'fechas': dict(_fechas_vistas['fechas'])}
+        try:
+            os.makedirs(os.path.dirname(FECHAS_VISTAS_PATH), exist_ok=True)
+            # Se escribe en un temporal y se reemplaza, para no dejar el archivo a medias
+            fd, temporal = tempfile.mkstemp(dir=os.path.dirname(FECHAS_VISTAS_PATH), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(datos, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporal, FECHAS_VISTAS_PATH)
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudieron guardar las fechas evaluadas: {str(e)}")
 
 class RSSReader:
     def __init__(self):
@@ -15,28 +95,34 @@ class RSSReader:
         self.feeds = {}
         # Configurar feedparser para manejar errores de codificación
         feedparser.PREFERRED_XML_PARSERS = ["html.parser"]
+        
+        # Sesión compartida para reutilizar conexiones (keep-alive) entre feeds del mismo sitio
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': feedparser.USER_AGENT})
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def add_feed(self, name, url):
         """Añade un nuevo feed RSS a la lista de feeds a monitorear."""
         # Almacena un nuevo feed en el diccionario usando el nombre como clave y la URL como valor
         self.feeds[name] = url
     
-    def _is_recent_entry(self, published_date_str, max_days_old=7):
-        """Verifica si una entrada es del día actual."""
+    def _is_recent_entry(self, published_date_str, max_days_old=7, today=None):
+        """Verifica si una entrada es del día actual (today se calcula una vez por feed)."""
         if not published_date_str:
             return False
             
         try:
-            # Parsear la fecha de publicación
-            published_date = parser.parse(published_date_str)
-            # Obtener la fecha actual
-            current_date = datetime.now()
+            # Los RSS usan fechas RFC 822: se prueba primero el parser de email,
+            # mucho más rápido que dateutil, que queda para los demás formatos
+            try:
+                published_date = parsedate_to_datetime(published_date_str)
+            except (TypeError, ValueError, IndexError):
+                published_date = parser.parse(published_date_str)
             # Verificar si la fecha de publicación es del día actual
-            return (
-                published_date.year == current_date.year and
-                published_date.month == current_date.month and
-                published_date.day == current_date.day
-            )
+            return published_date.date() == (today or datetime.now().date())
         except Exception as e:
             print(f"⚠️ Error al parsear fecha de publicación: {str(e)}")
             return False
@@ -47,54 +133,78 @@ class RSSReader:
         if feed_name not in self.feeds:
             raise ValueError(f"Feed '{feed_name}' no encontrado")
         
-        # Utiliza feedparser para obtener y analizar el contenido del feed RSS
+        # Descarga el feed con la sesión compartida y lo analiza con feedparser
         try:
-            feed = feedparser.parse(self.feeds[feed_name])
+            feed = obtener_feed(self.feeds[feed_name], self.session, timeout=15)
             
-            if hasattr(feed, 'status') and feed.status != 200:
+            if feed.status != 200:
                 print(f"⚠️ Advertencia: El feed {feed_name} retornó estado {feed.status}")
             
-            if not feed.entries:
-                print(f"⚠️ Advertencia: No se encontraron entradas en el feed {feed_name}")
-                return []
-            
-            entries = []
-            # Procesa cada entrada del feed hasta el límite especificado
-            for entry in feed.entries:
-                try:
-                    published = None
-                    if hasattr(entry, 'published'):
-                        published = entry.published
-                    elif hasattr(entry, 'updated'):
-                        published = entry.updated
-                        
-                    # Verificar si la entrada es reciente
-                    if not self._is_recent_entry(published):
-                        continue
-                    
-                    entry_data = {
-                        'title': entry.title if hasattr(entry, 'title') else 'Sin título',
-                        'link': entry.link if hasattr(entry, 'link') else None,
-                        'published': published,
-                        'summary': entry.summary if hasattr(entry, 'summary') else None,
-                        'feed_name': feed_name
-                    }
-                    entries.append(entry_data)
-                    
-                    # Si ya tenemos suficientes entradas recientes, salimos
-                    if len(entries) >= limit:
-                        break
-                        
-                except Exception as e:
-                    print(f"⚠️ Error al procesar entrada de {feed_name}: {str(e)}")
-                    continue
-            
-            return entries
+            return self._extract_entries(feed, feed_name, limit)
             
         except Exception as e:
             print(f"❌ Error al obtener el feed {feed_name}: {str(e)}")
             return []
     
+    def get_entries_from_content(self, feed_name, content, limit=10, response_headers=None):
+        """Obtiene las últimas entradas de un feed ya descargado (bytes o texto)."""
+        # feedparser analiza el contenido directamente, sin abrir otra conexión;
+        # los encabezados HTTP le permiten detectar la codificación
+        try:
+            feed = feedparser.parse(content, response_headers=response_headers)
+            return self._extract_entries(feed, feed_name, limit)
+        except Exception as e:
+            print(f"❌ Error al procesar el feed {feed_name}: {str(e)}")
+            return []
+    
+    def _extract_entries(self, feed, feed_name, limit):
+        """Convierte las entradas recientes de un feed analizado en diccionarios."""
+        if not feed.entries:
+            print(f"⚠️ Advertencia: No se encontraron entradas en el feed {feed_name}")
+            return []
+        
+        entries = []
+        today = datetime.now().date()
+        fechas_vistas = _cargar_fechas_vistas(today)
+        hay_fechas_nuevas = False
+        # Procesa cada entrada del feed hasta el límite especificado
+        for entry in feed.entries:
+            try:
+                # Las entradas de feedparser son diccionarios: get evita el __getattr__ basado en excepciones
+                published = entry.get('published') or entry.get('updated')
+                    
+                # Verificar si la entrada es reciente (cada fecha se parsea una sola vez por día)
+                es_reciente = fechas_vistas.get(published)
+                if es_reciente is None:
+                    es_reciente = self._is_recent_entry(published, today=today)
+                    if published:
+                        fechas_vistas[published] = es_reciente
+                        hay_fechas_nuevas = True
+                if not es_reciente:
+                    continue
+                
+                entry_data = {
+                    'title': entry.get('title', 'Sin título'),
+                    'link': entry.get('link'),
+                    'published': published,
+                    'summary': entry.get('summary'),
+                    'feed_name': feed_name
+                }
+                entries.append(entry_data)
+                
+                # Si ya tenemos suficientes entradas recientes, salimos
+                if len(entries) >= limit:
+                    break
+                    
+            except Exception as e:
+                print(f"⚠️ Error al procesar entrada de {feed_name}: {str(e)}")
+                continue
+        
+        # Se guardan al final de la ejecución (guardar_fechas_vistas), no después de cada feed
+        if hay_fechas_nuevas:
+            _marcar_fechas_nuevas()
+        return entries
+    
     def get_latest_entries(self, feed_name, limit=10):
         """Obtiene las últimas entradas de un feed específico."""
         return self.get_feed_entries(feed_name, limit)
@@ -103,22 +213,33 @@ class RSSReader:
         """Obtiene las últimas entradas de todos los feeds registrados."""
         # Crea un diccionario para almacenar las entradas de todos los feeds
         all_entries = {}
-        # Itera sobre cada feed registrado y obtiene sus últimas entradas
-        for feed_name in self.feeds:
+        if not self.feeds:
+            return all_entries
+        
+        # Descarga todos los feeds a la vez: el tiempo total es el del feed más lento, no la suma
+        with ThreadPoolExecutor(max_workers=min(16, len(self.feeds))) as executor:
+            futures = {feed_name: executor.submit(self.get_feed_entries, feed_name, limit) for feed_name in self.feeds}
+        
+        # Recorre los resultados en el orden en que se registraron los feeds
+        for feed_name, future in futures.items():
             try:
-                entries = self.get_feed_entries(feed_name, limit)
+                entries = future.result()
                 if entries:
                     all_entries[feed_name] = entries
             except Exception as e:
                 print(f"Error al obtener entradas de {feed_name}: {str(e)}")
-        return all_entries 
+        guardar_fechas_vistas()
+        return all_entries
+
+# Columnas del CSV que arma main, en el orden de los diccionarios de parse_rss_feed
+CAMPOS_NOTICIA = ['categoria', 'titulo', 'descripcion', 'link', 'fecha']
 
 def parse_rss_feed(url, categoria):
     """
     Parsea un feed RSS y retorna una lista de noticias
     """
     try:
-        feed = feedparser.parse(url)
+        feed = obtener_feed(url, headers={'User-Agent': feedparser.USER_AGENT}, timeout=15)
         noticias = []
         
         print(f"\nProcesando feed de {categoria}...")
@@ -131,7 +252,7 @@ def parse_rss_feed(url, categoria):
                 'fecha': entry.published if 'published' in entry else '',
             }
             noticias.append(noticia)
-            print(f"Noticia agregada: {noticia['titulo']}")
+            logger.debug("Noticia agregada: %s", noticia['titulo'])
             
         return noticias
     except Exception as e:
@@ -139,44 +260,37 @@ def parse_rss_feed(url, categoria):
         return []
 
 def main():
-    # Definir los feeds
-    feeds = [
-        {
-            'url': 'http://www.lapoliticaonline.com.ar/files/rss/ultimasnoticias.xml',
-            'categoria': 'Últimas noticias'
-        },
-        {
-            'url': 'http://www.lapoliticaonline.com.ar/files/rss/politica.xml',
-            'categoria': 'Política'
-        },
-        {
-            'url': 'http://www.lapoliticaonline.com.ar/files/rss/economia.xml',
-            'categoria': 'Economía'
-        }
-    ]
-    
-    # Lista para almacenar todas las noticias
-    todas_las_noticias = []
+    # Definir los feeds: categoría -> URL (cada categoría se procesa una sola vez)
+    feeds = {
+        'Últimas noticias': 'http://www.lapoliticaonline.com.ar/files/rss/ultimasnoticias.xml',
+        'Política': 'http://www.lapoliticaonline.com.ar/files/rss/politica.xml',
+        'Economía': 'http://www.lapoliticaonline.com.ar/files/rss/economia.xml',
+    }
     
     print("Iniciando lectura de feeds RSS...")
     
-    # Procesar cada feed
-    for feed in feeds:
-        noticias = parse_rss_feed(feed['url'], feed['categoria'])
-        todas_las_noticias.extend(noticias)
+    # Procesar los feeds en paralelo (el resultado conserva el orden del diccionario)
+    with ThreadPoolExecutor(max_workers=len(feeds)) as executor:
+        resultados = list(executor.map(lambda feed: parse_rss_feed(feed[1], feed[0]), feeds.items()))
     
-    # Crear DataFrame
-    if todas_las_noticias:
-        df = pd.DataFrame(todas_las_noticias)
-        
-        # Guardar en CSV
+    # Cada feed trae noticias de una sola categoría
+    por_categoria = Counter({categoria: len(noticias) for categoria, noticias in zip(feeds, resultados) if noticias})
+    total = sum(por_categoria.values())
+    
+    if total:
+        # Guardar en CSV: las noticias de cada feed se escriben directamente, sin juntarlas en otra lista
         filename = f'noticias_lpo_{datetime.now().strftime("%Y%m%d_%H%M")}.csv'
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        print(f"\nSe guardaron {len(todas_las_noticias)} noticias en {filename}")
+        with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames=CAMPOS_NOTICIA, lineterminator=os.linesep)
+            writer.writeheader()
+            for noticias in resultados:
+                writer.writerows(noticias)
+        print(f"\nSe guardaron {total} noticias en {filename}")
         
         # Mostrar resumen
         print("\nResumen por categoría:")
-        print(df['categoria'].value_counts())
+        for categoria, cantidad in por_categoria.most_common():
+            print(f"{categoria}: {cantidad}")
     else:
         print("\nNo se encontraron noticias para procesar.")
 
@@ -1,8 +1,41 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import csv
+import os
 from datetime import datetime
+from itertools import islice
 import re
+import logging
+from cache_http import get_con_cache, crear_sesion, TIMEOUT
+from parseo_html import leer_tabla
+
+# Las reuniones encontradas se registran en DEBUG, no con un print por fila
+logger = logging.getLogger(__name__)
+
+# Sesión del módulo: reutiliza la conexión (keep-alive) entre ejecuciones
+SESSION = crear_sesion()
+
+# Patrones compilados una sola vez para todas las filas
+_HORA_RE = re.compile(r'(\d{1,2}:\d{2})(.*)')
+_DIAS_RE = re.compile(r'lunes|martes|miércoles|jueves|viernes')
+
+# Muestra el HTML de las filas que podrían ser fechas (sólo para depurar cambios en la página)
+DEBUG = False
+
+def _leer_filas(rows):
+    """Datos de cada fila de la tabla: (texto del th de fecha o None, textos de los dos td o None, enlace de citación)"""
+    for row in rows:
+        th = next((celda for celda in row if celda.tag == 'th'), None)
+        cells = [celda for celda in row if celda.tag == 'td']
+        
+        # Debug: Mostrar las celdas de las filas que podrían contener fechas
+        if DEBUG and len(cells) != 2:  # Si no tiene dos celdas, podría ser una fecha
+            print("\nPosible fila de fecha:")
+            print(row)
+        
+        texto_fecha = th.texto if th is not None and th.colspan == '2' else None
+        if len(cells) != 2:
+            yield texto_fecha, None, ""
+            continue
+        yield texto_fecha, (cells[0].texto, cells[1].texto), cells[1].enlace or ""
 
 def scrape_comisiones():
     # URL de la página
@@ -10,104 +43,92 @@ def scrape_comisiones():
     
     try:
         print("Accediendo a la URL:", url)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers)
+        # Descarga condicional: si la página no cambió se usa la copia local
+        response = get_con_cache(url, SESSION, timeout=TIMEOUT)
         response.raise_for_status()
         
         print("Procesando contenido...")
-        soup = BeautifulSoup(response.text, 'html.parser')
         
-        # Lista para almacenar todas las reuniones
-        reuniones = []
+        # Reuniones encontradas, guardadas por columna (una lista por campo)
+        fechas, horas, salas, comisiones, descripciones, citacion_urls = [], [], [], [], [], []
         fecha_actual = None
         
-        # Encontrar la tabla principal
-        tabla = soup.find('table')
-        if not tabla:
+        # Encontrar la tabla principal (la página se lee sólo hasta el final de la tabla)
+        _, rows = leer_tabla(response.content)
+        if rows is None:
             print("⚠️ No se encontró ninguna tabla en la página")
             return None
             
         # Encontrar todas las filas de la tabla
-        rows = tabla.find_all('tr')
         print(f"Se encontraron {len(rows)} filas en la tabla")
         
-        # Debug: Mostrar el HTML de las filas que podrían contener fechas
-        print("\nExaminando filas para fechas:")
-        for row in rows:
-            if len(row.find_all('td')) != 2:  # Si no tiene dos celdas, podría ser una fecha
-                print("\nPosible fila de fecha:")
-                print(row.prettify())
+        if DEBUG:
+            print("\nExaminando filas para fechas:")
         
-        # Procesar las filas
-        for row in rows:
+        # Procesar las filas: las celdas de cada una se buscan una sola vez
+        for texto_fecha, textos, citacion_url in _leer_filas(rows):
             # Primero intentamos encontrar si es una fila de fecha (th)
-            th = row.find('th')
-            if th and th.get('colspan') == '2':
-                texto_fecha = th.get_text(strip=True)
-                if any(dia in texto_fecha.lower() for dia in ['lunes', 'martes', 'miércoles', 'jueves', 'viernes']):
-                    fecha_actual = texto_fecha
-                    print(f"\n📅 Nueva fecha encontrada: {fecha_actual}")
-                    continue
+            if texto_fecha is not None and _DIAS_RE.search(texto_fecha.lower()):
+                fecha_actual = texto_fecha
+                print(f"\n📅 Nueva fecha encontrada: {fecha_actual}")
+                continue
             
             # Si no es fecha, procesamos como reunión si tiene dos celdas
-            cells = row.find_all('td')
-            if len(cells) == 2:
-                texto_celda1 = cells[0].get_text(strip=True)
-                texto_celda2 = cells[1].get_text(strip=True)
+            if textos is not None:
+                texto_celda1, texto_celda2 = textos
                 
                 # Extraer hora y sala de la primera celda
-                hora_match = re.match(r'(\d{1,2}:\d{2})(.*)', texto_celda1)
+                hora_match = _HORA_RE.match(texto_celda1)
                 if hora_match:
                     hora = hora_match.group(1)
                     sala = hora_match.group(2).strip()
                     
                     # Extraer comisión y descripción de la segunda celda
-                    partes = texto_celda2.split('.')
-                    comision = partes[0].strip()
-                    descripcion = '.'.join(partes[1:]).strip() if len(partes) > 1 else ''
-                    
-                    # Buscar el enlace de la citación
-                    citacion_link = cells[1].find('a', href=True)
-                    citacion_url = citacion_link['href'] if citacion_link else ""
+                    # Sólo importa el primer punto: partition corta ahí sin armar una lista
+                    comision, _, descripcion = texto_celda2.partition('.')
+                    comision = comision.strip()
+                    descripcion = descripcion.strip()
                     
-                    reunion = {
-                        'fecha': fecha_actual,
-                        'hora': hora,
-                        'sala': sala,
-                        'comision': comision,
-                        'descripcion': descripcion,
-                        'citacion_url': citacion_url
-                    }
-                    
-                    reuniones.append(reunion)
-                    print(f"\n✓ Nueva reunión encontrada:")
-                    print(f"  Fecha: {fecha_actual}")
-                    print(f"  Hora: {hora}")
-                    print(f"  Sala: {sala}")
-                    print(f"  Comisión: {comision}")
-                    print(f"  Descripción: {descripcion[:100]}...")
+                    fechas.append(fecha_actual)
+                    horas.append(hora)
+                    salas.append(sala)
+                    comisiones.append(comision)
+                    descripciones.append(descripcion)
+                    citacion_urls.append(citacion_url)
+                    logger.debug("✓ Nueva reunión: fecha=%s hora=%s sala=%s comisión=%s descripción=%.100s",
+                                 fecha_actual, hora, sala, comision, descripcion)
         
-        print(f"\nTotal de reuniones encontradas: {len(reuniones)}")
+        print(f"\nTotal de reuniones encontradas: {len(fechas)}")
         
-        if not reuniones:
+        if not fechas:
             print("⚠️ No se encontraron reuniones")
             return None
         
-        # Crear DataFrame
-        df = pd.DataFrame(reuniones)
+        columnas = {
+            'fecha': fechas,
+            'hora': horas,
+            'sala': salas,
+            'comision': comisiones,
+            'descripcion': descripciones,
+            'citacion_url': citacion_urls
+        }
         
-        # Guardar en CSV
+        # Guardar en CSV (mismo formato que el to_csv de pandas, sin cargar pandas)
         filename = f'agenda_comisiones_{datetime.now().strftime("%Y%m%d_%H%M")}.csv'
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(columnas)
+            writer.writerows(zip(*columnas.values()))
         print(f"\n✅ Datos guardados exitosamente en {filename}")
         
-        # Mostrar las primeras filas del DataFrame
-        print("\nPrimeras entradas del DataFrame:")
-        print(df.head())
+        # Mostrar las primeras reuniones
+        print("\nPrimeras entradas:")
+        for fila in islice(zip(*columnas.values()), 5):
+            print(dict(zip(columnas, fila)))
         
-        return df
+        # El resultado es un DataFrame; pandas se importa recién acá, no al cargar el módulo
+        import pandas as pd
+        return pd.DataFrame(columnas)
         
     except Exception as e:
         print(f"❌ Error durante el procesamiento: {e}")
@@ -120,6 +141,6 @@ if __name__ == "__main__":
     df = scrape_comisiones()
     if df is not None:
         print("\n📊 Resumen final:")
-        print(f"Total de reuniones en el DataFrame: {len(df)}")
-        print("\nColumnas del DataFrame:")
+        print(f"Total de reuniones: {len(df)}")
+        print("\nColumnas:")
         print(df.columns.tolist()) 
\ No newline at end of file
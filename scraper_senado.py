@@ -1,8 +1,29 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import csv
+import os
 from datetime import datetime
+from itertools import islice
 import re
+import logging
+from cache_http import get_con_cache, crear_sesion, TIMEOUT
+from parseo_html import leer_tabla
+
+# Las reuniones encontradas se registran en DEBUG, no con un print por fila
+logger = logging.getLogger(__name__)
+
+# Sesión del módulo: reutiliza la conexión (keep-alive) entre ejecuciones
+SESSION = crear_sesion()
+
+# Patrones compilados una sola vez para todas las filas
+_FECHA_RE = re.compile(r'(\w+\s+\d+\s+de\s+\w+)')
+_HORA_RE = re.compile(r'(\d{1,2}:\d{2})\s*h')
+
+def _leer_filas(rows):
+    """Datos de las filas de 3 columnas: (comisión, día y hora, enlace a la agenda)"""
+    for row in rows:
+        # Obtener todas las celdas de la fila
+        cells = [celda for celda in row if celda.tag == 'td']
+        if len(cells) == 3:  # La tabla tiene 3 columnas: Comisión, Día y Hora, Próxima Reunión
+            yield cells[0].texto, cells[1].texto, cells[2].enlace or ""
 
 def scrape_senado():
     # URL de la página
@@ -10,91 +31,81 @@ def scrape_senado():
     
     try:
         print("Accediendo a la URL:", url)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers)
+        # Descarga condicional: si la página no cambió se usa la copia local
+        response = get_con_cache(url, SESSION, timeout=TIMEOUT)
         response.raise_for_status()
         
         print("Procesando contenido...")
-        soup = BeautifulSoup(response.text, 'html.parser')
         
-        # Lista para almacenar todas las reuniones
-        reuniones = []
+        # Reuniones encontradas, guardadas por columna (una lista por campo)
+        comisiones, tipos_reunion, fechas, horas, dias_hora, agenda_urls = [], [], [], [], [], []
         
         # Encontrar la tabla de agenda de reuniones
-        # La tabla está después del encabezado "Agenda de Reuniones"
-        agenda_header = soup.find('h1', string='Agenda de Reuniones')
-        if not agenda_header:
+        # La tabla está después del encabezado "Agenda de Reuniones" (la página se lee sólo hasta el final de la tabla)
+        hay_encabezado, rows = leer_tabla(response.content, encabezado='Agenda de Reuniones')
+        if not hay_encabezado:
             print("⚠️ No se encontró la sección de agenda")
             return None
-            
-        # Buscar la tabla después del encabezado
-        tabla = agenda_header.find_next('table')
-        if not tabla:
+        if rows is None:
             print("⚠️ No se encontró la tabla de reuniones")
             return None
         
         # Procesar las filas de la tabla
-        rows = tabla.find_all('tr')
         print(f"Se encontraron {len(rows)} filas en la tabla")
         
-        for row in rows:
-            # Obtener todas las celdas de la fila
-            cells = row.find_all('td')
+        for comision, dia_hora, agenda_link in _leer_filas(rows):
+            # Procesar día y hora
+            # El formato suele ser "ASESORES - Día de la semana DD de mes - HH:mm h"
+            dia_hora_parts = dia_hora.split('-')
+            tipo_reunion = dia_hora_parts[0].strip() if len(dia_hora_parts) > 1 else ""
+            
+            # Extraer fecha y hora usando expresiones regulares
+            fecha_match = _FECHA_RE.search(dia_hora)
+            hora_match = _HORA_RE.search(dia_hora)
             
-            if len(cells) == 3:  # La tabla tiene 3 columnas: Comisión, Día y Hora, Próxima Reunión
-                comision = cells[0].get_text(strip=True)
-                dia_hora = cells[1].get_text(strip=True)
-                agenda_link = cells[2].find('a')['href'] if cells[2].find('a') else ""
-                
-                # Procesar día y hora
-                # El formato suele ser "ASESORES - Día de la semana DD de mes - HH:mm h"
-                dia_hora_parts = dia_hora.split('-')
-                tipo_reunion = dia_hora_parts[0].strip() if len(dia_hora_parts) > 1 else ""
-                
-                # Extraer fecha y hora usando expresiones regulares
-                fecha_match = re.search(r'(\w+\s+\d+\s+de\s+\w+)', dia_hora)
-                hora_match = re.search(r'(\d{1,2}:\d{2})\s*h', dia_hora)
-                
-                fecha = fecha_match.group(1) if fecha_match else ""
-                hora = hora_match.group(1) if hora_match else ""
-                
-                reunion = {
-                    'comision': comision,
-                    'tipo_reunion': tipo_reunion,
-                    'fecha': fecha,
-                    'hora': hora,
-                    'dia_hora_completo': dia_hora,
-                    'agenda_url': f"https://www.senado.gob.ar{agenda_link}" if agenda_link else ""
-                }
-                
-                reuniones.append(reunion)
-                print(f"\n✓ Nueva reunión encontrada:")
-                print(f"  Comisión: {comision}")
-                print(f"  Tipo: {tipo_reunion}")
-                print(f"  Fecha: {fecha}")
-                print(f"  Hora: {hora}")
+            fecha = fecha_match.group(1) if fecha_match else ""
+            hora = hora_match.group(1) if hora_match else ""
+            
+            comisiones.append(comision)
+            tipos_reunion.append(tipo_reunion)
+            fechas.append(fecha)
+            horas.append(hora)
+            dias_hora.append(dia_hora)
+            agenda_urls.append(f"https://www.senado.gob.ar{agenda_link}" if agenda_link else "")
+            logger.debug("✓ Nueva reunión: comisión=%s tipo=%s fecha=%s hora=%s",
+                         comision, tipo_reunion, fecha, hora)
         
-        print(f"\nTotal de reuniones encontradas: {len(reuniones)}")
+        print(f"\nTotal de reuniones encontradas: {len(comisiones)}")
         
-        if not reuniones:
+        if not comisiones:
             print("⚠️ No se encontraron reuniones")
             return None
         
-        # Crear DataFrame
-        df = pd.DataFrame(reuniones)
+        columnas = {
+            'comision': comisiones,
+            'tipo_reunion': tipos_reunion,
+            'fecha': fechas,
+            'hora': horas,
+            'dia_hora_completo': dias_hora,
+            'agenda_url': agenda_urls
+        }
         
-        # Guardar en CSV
+        # Guardar en CSV (mismo formato que el to_csv de pandas, sin cargar pandas)
         filename = f'agenda_senado_{datetime.now().strftime("%Y%m%d_%H%M")}.csv'
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(columnas)
+            writer.writerows(zip(*columnas.values()))
         print(f"\n✅ Datos guardados exitosamente en {filename}")
         
-        # Mostrar las primeras filas del DataFrame
-        print("\nPrimeras entradas del DataFrame:")
-        print(df.head())
+        # Mostrar las primeras reuniones
+        print("\nPrimeras entradas:")
+        for fila in islice(zip(*columnas.values()), 5):
+            print(dict(zip(columnas, fila)))
         
-        return df
+        # El resultado es un DataFrame; pandas se importa recién acá, no al cargar el módulo
+        import pandas as pd
+        return pd.DataFrame(columnas)
         
     except Exception as e:
         print(f"❌ Error durante el procesamiento: {e}")
@@ -107,6 +118,6 @@ if __name__ == "__main__":
     df = scrape_senado()
     if df is not None:
         print("\n📊 Resumen final:")
-        print(f"Total de reuniones en el DataFrame: {len(df)}")
-        print("\nColumnas del DataFrame:")
+        print(f"Total de reuniones: {len(df)}")
+        print("\nColumnas:")
         print(df.columns.tolist()) 
\ No newline at end of file